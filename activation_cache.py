@@ -0,0 +1,122 @@
+import threading
+import time
+from datetime import datetime
+
+from fastapi import HTTPException
+
+from database import get_connection
+from key_filter import KeyFilter
+
+# ---------- Settings ----------
+TTL_SECONDS = 30
+MAX_ENTRIES = 10000
+
+# code -> code_id
+_ids = {}
+# code_id -> code
+_codes = {}
+# code_id -> (cached_at, row)
+_rows = {}
+_lock = threading.Lock()
+
+def _load_codes():
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("SELECT code FROM activation_codes")
+    codes = [r[0] for r in cur.fetchall()]
+    conn.close()
+    return codes
+
+def _codes_version():
+    # يتغير عند إنشاء كود جديد (في أي worker)؛ قراءة واحدة من الفهرس
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("SELECT MAX(id) FROM activation_codes")
+    version = cur.fetchone()[0]
+    conn.close()
+    return version
+
+# كل الأكواد الموجودة؛ الكود غير الموجود يُرفض دون قراءة القاعدة
+codes = KeyFilter(loader=_load_codes, version=_codes_version)
+
+def _load_row(code_id: int):
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("SELECT * FROM activation_codes WHERE id = ?", (code_id,))
+    row = cur.fetchone()
+    columns = [c[0] for c in cur.description] if row else []
+    conn.close()
+
+    if not row:
+        return None
+    row = dict(zip(columns, row))
+    expires_at = row.get("expires_at")
+    row["_expiry"] = datetime.fromisoformat(expires_at) if expires_at else None
+    return row
+
+def _store(code_id: int, row: dict, code: str = None):
+    with _lock:
+        if len(_rows) >= MAX_ENTRIES and code_id not in _rows:
+            oldest = next(iter(_rows))
+            _rows.pop(oldest, None)
+            _ids.pop(_codes.pop(oldest, None), None)
+        _rows[code_id] = (time.monotonic(), row)
+        if code is not None:
+            _ids[code] = code_id
+            _codes[code_id] = code
+
+def _fresh(code_id: int):
+    item = _rows.get(code_id)
+    if not item:
+        return None
+    cached_at, row = item
+    if time.monotonic() - cached_at > TTL_SECONDS:
+        return None
+    return row
+
+def _usable(row: dict) -> bool:
+    if not row.get("is_active"):
+        return False
+    # الكاش قد يتأخر حتى TTL_SECONDS عن worker آخر، فالخصم نفسه يتحقق من الحد أيضاً
+    limit = row.get("usage_limit")
+    if limit is not None and (row.get("usage_count") or 0) >= limit:
+        return False
+    expiry = row["_expiry"]
+    return expiry is None or expiry >= datetime.utcnow()
+
+def resolve(code: str, validator) -> int:
+    """
+    يعيد رقم الكود من الكاش إن كان صالحاً، وإلا ينفذ التحقق الكامل من القاعدة.
+    validator هو activation_required الأصلي.
+    """
+    code_id = _ids.get(code)
+    row = _fresh(code_id) if code_id is not None else None
+
+    if row is not None and _usable(row):
+        return code_id
+
+    # cache miss / stale / expired: the real check decides (and raises its own errors)
+    invalidate(code_id)
+    if not codes.check(code):
+        raise HTTPException(status_code=401, detail="Invalid activation code")
+    code_id = validator(code)
+    row = _load_row(code_id)
+    if row is not None:
+        _store(code_id, row, code)
+    return code_id
+
+def get_row(code_id: int):
+    """صف الاشتراك من الكاش (يُحمّل من القاعدة عند الحاجة)"""
+    row = _fresh(code_id)
+    if row is None:
+        row = _load_row(code_id)
+        if row is not None:
+            _store(code_id, row)
+    return row
+
+def invalidate(code_id: int):
+    if code_id is None:
+        return
+    with _lock:
+        _rows.pop(code_id, None)
+        _ids.pop(_codes.pop(code_id, None), None)
@@ -0,0 +1,158 @@
+import time
+
+from database import get_connection
+
+# ---------- Settings ----------
+PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+# الحالة تُحسب داخل الاستعلام اعتماداً على expires_ts (ثواني UTC)
+EXPIRED_SQL = "(expires_ts IS NOT NULL AND expires_ts < :now)"
+EXHAUSTED_SQL = "(usage_limit IS NOT NULL AND usage_count >= usage_limit)"
+# "expired" في الواجهة (كما في النسخة الأصلية) = انتهى وقته أو استُهلك؛
+# نفس التعبير للفلتر ?expired= ولعلامة كل عنصر وللعدد
+UNUSABLE_SQL = f"({EXPIRED_SQL} OR {EXHAUSTED_SQL})"
+
+def ensure_schema():
+    """
+    يضيف عمود انتهاء رقمي + فهارس لجدول activation_codes (آمن للتكرار).
+    expires_ts يُحدَّث تلقائياً عبر triggers عند الإدراج أو تغيير expires_at.
+    """
+    conn = get_connection()
+    cur = conn.cursor()
+
+    cur.execute("PRAGMA table_info(activation_codes)")
+    columns = {r[1] for r in cur.fetchall()}
+    if "expires_ts" not in columns:
+        cur.execute("ALTER TABLE activation_codes ADD COLUMN expires_ts INTEGER")
+    if "created_at" not in columns:
+        cur.execute("ALTER TABLE activation_codes ADD COLUMN created_at TEXT")
+    if "plan" not in columns:
+        # اسم الباقة عند الإنشاء (تحدد حدود المعدل والتوكنات)
+        cur.execute("ALTER TABLE activation_codes ADD COLUMN plan TEXT")
+
+    cur.execute("""
+        UPDATE activation_codes
+        SET expires_ts = CAST(strftime('%s', expires_at) AS INTEGER)
+        WHERE expires_at IS NOT NULL AND expires_ts IS NULL
+    """)
+
+    cur.execute("""
+        CREATE TRIGGER IF NOT EXISTS activation_codes_expires_ts_insert
+        AFTER INSERT ON activation_codes
+        WHEN NEW.expires_at IS NOT NULL
+        BEGIN
+            UPDATE activation_codes
+            SET expires_ts = CAST(strftime('%s', NEW.expires_at) AS INTEGER)
+            WHERE id = NEW.id;
+        END
+    """)
+    cur.execute("""
+        CREATE TRIGGER IF NOT EXISTS activation_codes_expires_ts_update
+        AFTER UPDATE OF expires_at ON activation_codes
+        BEGIN
+            UPDATE activation_codes
+            SET expires_ts = CAST(strftime('%s', NEW.expires_at) AS INTEGER)
+            WHERE id = NEW.id;
+        END
+    """)
+
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_activation_codes_code ON activation_codes (code)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_activation_codes_expires_ts ON activation_codes (expires_ts)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_activation_codes_created_at ON activation_codes (created_at)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_activation_codes_active ON activation_codes (is_active, id)")
+
+    conn.commit()
+    conn.close()
+
+def _prefix_range(prefix: str):
+    # code LIKE 'AB%' لا يستخدم الفهرس في SQLite، لذلك نستخدم نطاقاً
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+def list_codes(
+    columns,
+    cursor: int = None,
+    limit: int = PAGE_SIZE,
+    active: bool = None,
+    expired: bool = None,
+    exhausted: bool = None,
+    created_from: str = None,
+    created_to: str = None,
+    prefix: str = None,
+    with_counts: bool = None,
+):
+    """
+    صفحة من الأكواد مرتبة تنازلياً حسب id (keyset pagination).
+    يعيد: items, next_cursor, counts
+    counts تمسح الجدول كاملاً، لذلك تُحسب افتراضياً للصفحة الأولى فقط (دون cursor)
+    وتكون None لبقية الصفحات ما لم يُطلب with_counts=True.
+    """
+    limit = min(max(limit, 1), MAX_PAGE_SIZE)
+    where = []
+    params = {"now": int(time.time()), "limit": limit}
+
+    if cursor is not None:
+        where.append("id < :cursor")
+        params["cursor"] = cursor
+    if active is not None:
+        where.append("is_active = :active")
+        params["active"] = 1 if active else 0
+    if expired is not None:
+        where.append(UNUSABLE_SQL if expired else f"NOT {UNUSABLE_SQL}")
+    if exhausted is not None:
+        where.append(EXHAUSTED_SQL if exhausted else f"NOT {EXHAUSTED_SQL}")
+    if created_from:
+        where.append("created_at >= :created_from")
+        params["created_from"] = created_from
+    if created_to:
+        where.append("created_at < :created_to")
+        params["created_to"] = created_to
+    prefix = (prefix or "").strip().upper()
+    if prefix:
+        params["prefix_lo"], params["prefix_hi"] = _prefix_range(prefix)
+        where.append("code >= :prefix_lo AND code < :prefix_hi")
+
+    sql = f"""
+        SELECT {", ".join(columns)},
+               {UNUSABLE_SQL} AS expired
+        FROM activation_codes
+        {"WHERE " + " AND ".join(where) if where else ""}
+        ORDER BY id DESC
+        LIMIT :limit
+    """
+
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(sql, params)
+    names = [c[0] for c in cur.description]
+    items = [dict(zip(names, r)) for r in cur.fetchall()]
+
+    counts = None
+    if with_counts is None:
+        with_counts = cursor is None
+    if with_counts:
+        cur.execute(f"""
+            SELECT
+                COUNT(*),
+                COALESCE(SUM(is_active = 1), 0),
+                COALESCE(SUM({UNUSABLE_SQL}), 0),
+                COALESCE(SUM({EXHAUSTED_SQL}), 0)
+            FROM activation_codes
+        """, {"now": params["now"]})
+        total, active_count, expired_count, exhausted_count = cur.fetchone()
+        counts = {
+            "total": total,
+            "active": active_count,
+            "expired": expired_count,
+            "exhausted": exhausted_count,
+        }
+    conn.close()
+
+    for item in items:
+        item["expired"] = bool(item["expired"])
+
+    return {
+        "items": items,
+        "next_cursor": items[-1]["id"] if len(items) == limit else None,
+        "counts": counts,
+    }
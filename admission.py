@@ -0,0 +1,115 @@
+import heapq
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from fastapi import HTTPException
+
+# ---------- Settings ----------
+# عدد الطلبات المتزامنة التي يتحملها مفتاح Gemini واحد
+PER_KEY_CONCURRENCY = int(os.getenv("PER_KEY_CONCURRENCY", "4"))
+MAX_BUCKETS = 100000
+
+def _too_many(retry_after: float, detail: str):
+    raise HTTPException(
+        status_code=429,
+        detail=detail,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+    )
+
+class Admission:
+    """
+    التحكم في القبول قبل الوصول إلى مفاتيح Gemini:
+    - token bucket لكل ترخيص/جهاز (rate طلب في الدقيقة، burst رصيد أقصى).
+    - حد عام للطلبات الجارية = max_in_flight إن أُعطي (سعة مسار التوليد async)،
+      وإلا عدد المفاتيح × PER_KEY_CONCURRENCY (المسار المتزامن الذي يحجز thread لكل طلب).
+    الرفض فوري (429 + Retry-After) دون انتظار ودون لمس القاعدة.
+    الحالة في الذاكرة فقط؛ القفل يحمي عمليات حسابية قصيرة لا I/O فيها.
+    """
+
+    def __init__(self, key_count: int, per_key=PER_KEY_CONCURRENCY, max_buckets=MAX_BUCKETS,
+                 max_in_flight=None):
+        self.max_in_flight = max_in_flight or max(key_count, 1) * per_key
+        self.max_buckets = max_buckets
+        self.in_flight = 0
+        self.admitted = 0
+        self.rate_limited = 0
+        self.saturated = 0
+        self._buckets = {}   # key -> [tokens, last_refill]
+        self._lock = threading.Lock()
+
+    def _prune(self, now):
+        # حذف الـ buckets الممتلئة (غير النشطة) أولاً؛ إعادتها لاحقاً لا تغيّر شيئاً
+        full = [k for k, (tokens, last, burst, rate) in self._buckets.items()
+                if tokens + (now - last) * rate >= burst]
+        for k in full:
+            del self._buckets[k]
+
+        # كلها نشطة (مثلاً مفاتيح كثيرة بمعدل بطيء): حذف الأقدم استخداماً مع هامش 10%
+        excess = len(self._buckets) - self.max_buckets + max(self.max_buckets // 10, 1)
+        if excess > 0:
+            for k in heapq.nsmallest(excess, self._buckets, key=lambda k: self._buckets[k][1]):
+                del self._buckets[k]
+
+    def limit(self, key: str, rate_per_minute: float, burst: int):
+        """خصم رصيد واحد من bucket المفتاح أو رفع 429"""
+        rate = rate_per_minute / 60.0
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_buckets:
+                    self._prune(now)
+                bucket = self._buckets[key] = [float(burst), now, burst, rate]
+            else:
+                bucket[0] = min(float(burst), bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+                bucket[2] = burst
+                bucket[3] = rate
+
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                self.admitted += 1
+                return
+            self.rate_limited += 1
+            wait = (1 - bucket[0]) / rate if rate > 0 else 60
+
+        _too_many(wait, "Rate limit exceeded")
+
+    @contextmanager
+    def slot(self):
+        """حجز مكان من الحد العام للطلبات الجارية طوال مدة الطلب"""
+        with self._lock:
+            if self.in_flight >= self.max_in_flight:
+                self.saturated += 1
+                full = True
+            else:
+                self.in_flight += 1
+                full = False
+        if full:
+            _too_many(1, "Server busy")
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    @contextmanager
+    def admit(self, key: str, rate_per_minute: float, burst: int):
+        # الحد العام أولاً: الرفض بسبب الازدحام لا يستهلك رصيد المستخدم
+        with self.slot():
+            self.limit(key, rate_per_minute, burst)
+            yield
+
+    def stats(self):
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "buckets": len(self._buckets),
+            "admitted": self.admitted,
+            "rate_limited": self.rate_limited,
+            "saturated": self.saturated,
+        }
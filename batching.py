@@ -1,8 +1,9 @@
-import json, itertools, os
-import google.generativeai as genai
+import os
 from fastapi import HTTPException
+from model_pool import ModelPool
+from model_router import ModelRouter, DEFAULT_MODEL
+from quiz_json import parse_questions
 
-MODEL = "gemini-2.5-flash-lite"
 MAX_RETRY = 2
 
 keys = [os.getenv(f"GEMINI_KEY_{i}") for i in range(1, 12)]
@@ -10,19 +11,8 @@ keys = [k for k in keys if k]
 if not keys:
     raise RuntimeError("No Gemini API keys found")
 
-key_cycle = itertools.cycle(keys)
-
-def get_model():
-    genai.configure(api_key=next(key_cycle))
-    return genai.GenerativeModel(MODEL)
-
-def safe_json(text: str):
-    try:
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        return json.loads(text[start:end])
-    except:
-        return None
+model_pool = ModelPool(keys, DEFAULT_MODEL)
+model_router = ModelRouter()
 
 def lang_instruction(lang: str):
     return (
@@ -67,27 +57,34 @@ def generate_batch(
     language: str
 ):
     batch_size = min(max(batch_size, 5), 20)
+    questions = []
+    seen = set()
+    model = None
+    error = "Insufficient questions"
 
     for attempt in range(MAX_RETRY + 1):
+        # إعادة المحاولة تطلب الأسئلة الناقصة فقط، والصالحة السابقة تبقى
+        need = batch_size - len(questions)
         try:
-            model = get_model()
-            prompt = build_prompt(topic, language, batch_size)
-            response = model.generate_content(prompt)
-            data = safe_json(response.text)
-
-            if not data or "questions" not in data:
-                raise ValueError("Invalid JSON from model")
+            prompt = build_prompt(topic, language, need)
+            response, model = model_router.generate(
+                "quiz_batch", lambda m: model_pool.generate_content(prompt, model=m)
+            )
+        except Exception as e:
+            error = str(e)
+            continue
 
-            if len(data["questions"]) < batch_size:
-                raise ValueError("Insufficient questions")
+        fresh = [q for q in parse_questions(response.text) if q["q"] not in seen][:need]
+        seen.update(q["q"] for q in fresh)
+        questions.extend(fresh)
 
+        if len(questions) >= batch_size:
             return {
-                "questions": data["questions"][:batch_size]
+                "questions": questions,
+                "model": model
             }
 
-        except Exception as e:
-            if attempt == MAX_RETRY:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Batch generation failed: {str(e)}"
-                )
+    raise HTTPException(
+        status_code=500,
+        detail=f"Batch generation failed: {error} ({len(questions)}/{batch_size})"
+    )
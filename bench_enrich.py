@@ -0,0 +1,138 @@
+"""
+مقارنة أداء enrich_and_enforce الجديدة (report_text) مع النسخة السابقة.
+تشغيل: python bench_enrich.py
+"""
+import random
+import time
+
+from report_text import LINGUISTIC_ENRICHMENT, enrich_and_enforce, enrich_fields
+
+FIELDS = ("goal", "summary", "steps", "strategies", "strengths", "improve", "recomm")
+
+# ---------- النسخة السابقة (كما كانت في main taraf) ----------
+def legacy_enrich_and_enforce(text: str, min_words=25, max_words=35, report_type: str = "") -> str:
+    """
+    إثراء النص وتطبيق الحد الأدنى والأقصى للكلمات بشكل ذكي
+    """
+    words = text.split()
+    
+    if len(words) == 0:
+        return text
+    
+    # تحليل السياق من نوع التقرير
+    context_keywords = {
+        "تقرير علاجي": ["العلاج", "الدعم", "تحسين", "تقدم"],
+        "تقرير سلوكي": ["السلوك", "تحفيز", "تعزيز", "مكافأة"],
+        "تقرير تقييمي": ["تقييم", "قياس", "نتائج", "مؤشرات"],
+        "تقرير نشاط": ["نشاط", "مشاركة", "تفاعل", "تطبيق"],
+    }
+    
+    # تحديد الكلمات الإثرائية المناسبة للسياق
+    enrichment_phrases = []
+    for keyword, phrases in context_keywords.items():
+        if keyword in report_type:
+            enrichment_phrases.extend(phrases)
+    
+    # إذا لم نجد سياق محدد، نستخدم الإثراء العام
+    if not enrichment_phrases:
+        enrichment_phrases = LINGUISTIC_ENRICHMENT
+    
+    # إثراء النص إذا كان قصيراً
+    if len(words) < min_words:
+        # احتساب عدد الكلمات المطلوبة
+        words_needed = min_words - len(words)
+        
+        # إضافة عبارات إثرائية ذكية
+        if len(words) < 15:  # إذا كان النص قصير جداً
+            # إضافة عبارات تربوية محسنة
+            enhancements = [
+                "بما يعزز من جودة الممارسة التعليمية وينسجم مع أهداف المنهج",
+                "وذلك لتحقيق نواتج التعلم المستهدفة ورفع مستوى التحصيل الدراسي",
+                "بما يدعم التطوير المهني المستدام ويعزز فاعلية العملية التعليمية",
+                "ويسهم في بناء بيئة تعلمية محفزة تدعم الإبداع والتميز",
+                "وذلك تماشياً مع رؤية التعليم الحديثة واستراتيجياته التطويرية",
+                "بما يرتقي بالممارسات الصفية ويعزز الشراكة المجتمعية الفاعلة",
+            ]
+            
+            for enhancement in enhancements[:min(2, words_needed//10)]:
+                if len(words) < min_words:
+                    text += " " + enhancement
+                    words = text.split()
+        
+        # إذا مازال النقص موجوداً
+        while len(words) < min_words:
+            # اختيار عبارة إثرائية مناسبة
+            phrase = random.choice(enrichment_phrases)
+            
+            # التأكد من أن الإضافة تتناسب مع سياق النص
+            if not any(word in text for word in phrase.split()[:3]):
+                text += " " + phrase
+                words = text.split()
+    
+    # تقليم النص إذا تجاوز الحد الأقصى
+    if len(words) > max_words:
+        # المحاولة لتقليم النص بشكل ذكي
+        sentences = text.split('،')
+        if len(sentences) > 1:
+            trimmed_text = ""
+            current_words = 0
+            for sentence in sentences:
+                sentence_words = sentence.split()
+                if current_words + len(sentence_words) <= max_words - 5:  # ترك مساحة للختام
+                    if trimmed_text:
+                        trimmed_text += "، " + sentence
+                    else:
+                        trimmed_text = sentence
+                    current_words += len(sentence_words)
+                else:
+                    break
+            
+            if current_words >= min_words:
+                text = trimmed_text + "، مما يسهم في تحقيق الأهداف التربوية المنشودة."
+                words = text.split()
+        
+        # إذا مازال الطول زائداً، قص الكلمات الزائدة
+        if len(words) > max_words:
+            text = " ".join(words[:max_words])
+    
+    # تحسين جودة النص النهائي
+    text = text.replace("  ", " ").strip()
+    
+    # إضافة نقطة نهائية إذا لم تكن موجودة
+    if text and text[-1] not in [".", "!", "؟"]:
+        text += "."
+    
+    return text
+
+# ---------- بيانات الاختبار ----------
+WORDS = (
+    "تم تنفيذ الدرس باستخدام استراتيجيات التعلم النشط مع مراعاة الفروق الفردية "
+    "بين الطلاب وتوظيف الوسائل التعليمية المناسبة لتحقيق الأهداف المرسومة"
+).split()
+
+def make_text(rng, n_words):
+    parts = []
+    for i in range(n_words):
+        parts.append(rng.choice(WORDS) + ("،" if i % 9 == 8 else ""))
+    return " ".join(parts)
+
+def make_reports(count):
+    rng = random.Random(1)
+    return [
+        {field: make_text(rng, rng.choice((6, 12, 20, 28, 45, 80))) for field in FIELDS}
+        for _ in range(count)
+    ]
+
+def bench(name, fn, reports):
+    start = time.perf_counter()
+    for fields in reports:
+        fn(fields)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} {len(reports) / elapsed:>10.0f} reports/s  ({elapsed * 1000:.1f} ms)")
+
+if __name__ == "__main__":
+    reports = make_reports(2000)
+
+    bench("legacy", lambda f: {k: legacy_enrich_and_enforce(v, 25, 30) for k, v in f.items()}, reports)
+    bench("single", lambda f: {k: enrich_and_enforce(v, 25, 30) for k, v in f.items()}, reports)
+    bench("batch", lambda f: enrich_fields(f, 25, 30), reports)
@@ -0,0 +1,272 @@
+"""
+اختبار ضغط وصحة لتخزين التراخيص تحت طلبات متزامنة.
+يملأ التخزين بـ N ترخيص ثم يطلق validate وعمليات الإدارة من عدة threads، ويقيس:
+    - العمليات الناجحة/ثانية وزمن p50 / p95 / p99 لكل نوع عملية (الفاشلة لا تدخل فيها)
+    - نسبة الأخطاء (استثناءات غير LicenseError) ونسبة الرفض
+    - التحديثات الضائعة (طلبات نجح validate لها ولم تظهر في used_requests)
+    - سلامة الحالة النهائية (الملف يُقرأ، التراخيص المنشأة موجودة، لا مفاتيح مكررة)
+يخرج بـ exit code 1 إذا وُجدت أخطاء أو تحديثات ضائعة أو خلل في الحالة النهائية.
+
+يعمل مع أي تخزين يوفر دوال JsonLicenseStore (create / validate / get / list / update):
+    python bench_license_store.py
+    python bench_license_store.py --store json --licenses 2000 --threads 32 --seconds 10
+    python bench_license_store.py --store my_module:SqliteLicenseStore
+"""
+import argparse
+import importlib
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+
+from license_store import JsonLicenseStore, LicenseError
+
+STORES = {
+    "json": JsonLicenseStore,
+}
+
+# حد كبير حتى لا يتوقف validate بسبب "Limit reached"
+MAX_REQUESTS = 10 ** 9
+DEFAULT_MIX = "validate=80,get=10,update=5,create=5"
+
+def load_store_class(spec: str):
+    if spec in STORES:
+        return STORES[spec]
+    module, _, name = spec.partition(":")
+    return getattr(importlib.import_module(module), name)
+
+def parse_mix(mix: str):
+    ops, weights = [], []
+    for part in mix.split(","):
+        op, _, weight = part.partition("=")
+        ops.append(op.strip())
+        weights.append(float(weight))
+    return ops, weights
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+class Harness:
+    def __init__(self, store, keys, mix, seed=0):
+        self.store = store
+        self.keys = keys
+        self.ops, self.weights = parse_mix(mix)
+
+        self._lock = threading.Lock()
+        self.expected = Counter()           # key -> عدد validate الناجحة
+        self.created = []                   # مفاتيح أنشأها الاختبار أثناء التشغيل
+        self.latency = defaultdict(list)    # op -> [ms] للعمليات الناجحة فقط
+        self.attempts = Counter()           # op -> كل المحاولات
+        self.rejected = Counter()           # (op, سبب LicenseError)
+        self.errors = Counter()             # (op, نوع الاستثناء)
+        self.seed = seed
+
+    def _one(self, rng, op):
+        if op == "validate":
+            i = rng.randrange(len(self.keys))
+            self.store.validate(self.keys[i], f"device-{i}")
+            return ("validate", self.keys[i])
+        if op == "get":
+            self.store.get(rng.choice(self.keys))
+        elif op == "list":
+            self.store.list()
+        elif op == "update":
+            # نفس القيمة: أي تغيير في الحالة النهائية سببه التزامن فقط
+            self.store.update(rng.choice(self.keys), max_requests=MAX_REQUESTS)
+        elif op == "create":
+            return ("create", self.store.create(days=30, max_requests=MAX_REQUESTS, owner="bench"))
+        else:
+            raise ValueError(f"unknown op: {op}")
+        return None
+
+    def worker(self, index, deadline, max_ops):
+        rng = random.Random(self.seed * 1000 + index)
+        done = 0
+        while time.perf_counter() < deadline and (not max_ops or done < max_ops):
+            op = rng.choices(self.ops, self.weights)[0]
+            t0 = time.perf_counter()
+            ok = False
+            try:
+                result = self._one(rng, op)
+                ok = True
+            except LicenseError as e:
+                with self._lock:
+                    self.rejected[(op, str(e))] += 1
+                result = None
+            except Exception as e:
+                with self._lock:
+                    self.errors[(op, type(e).__name__)] += 1
+                result = None
+            elapsed = (time.perf_counter() - t0) * 1000
+            done += 1
+
+            with self._lock:
+                self.attempts[op] += 1
+                if ok:
+                    self.latency[op].append(elapsed)
+                if result and result[0] == "validate":
+                    self.expected[result[1]] += 1
+                elif result and result[0] == "create":
+                    self.created.append(result[1])
+
+    def run(self, threads, seconds, ops_per_thread=0):
+        deadline = time.perf_counter() + seconds
+        pool = [
+            threading.Thread(target=self.worker, args=(i, deadline, ops_per_thread))
+            for i in range(threads)
+        ]
+        t0 = time.perf_counter()
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        return time.perf_counter() - t0
+
+    def check(self):
+        """مقارنة الحالة النهائية بما أكده التخزين للعملاء"""
+        try:
+            final = self.store.list()
+        except Exception as e:
+            return {"readable": False, "error": f"{type(e).__name__}: {e}"}
+
+        by_key = Counter(l["license_key"] for l in final)
+        records = {l["license_key"]: l for l in final}
+
+        lost = 0
+        affected = 0
+        over = 0
+        for key in self.keys:
+            actual = records[key]["used_requests"] if key in records else 0
+            diff = self.expected[key] - actual
+            if diff > 0:
+                lost += diff
+                affected += 1
+            elif diff < 0:
+                over += -diff
+
+        return {
+            "readable": True,
+            "licenses": len(final),
+            "expected_increments": sum(self.expected.values()),
+            "lost_updates": lost,
+            "licenses_with_lost_updates": affected,
+            "unexpected_increments": over,
+            "missing_seeded": sum(1 for k in self.keys if k not in records),
+            "missing_created": sum(1 for k in self.created if k not in records),
+            "duplicate_keys": sum(1 for n in by_key.values() if n > 1),
+            "wrong_device": sum(
+                1 for i, k in enumerate(self.keys)
+                if k in records and records[k]["bound_device"] not in (None, f"device-{i}")
+            ),
+        }
+
+def seed_store(store, count):
+    keys = []
+    for _ in range(count):
+        keys.append(store.create(days=30, max_requests=MAX_REQUESTS, owner="bench"))
+    return keys
+
+def problems(harness, consistency):
+    """أسباب اعتبار التشغيل فاشلاً (قائمة فارغة = سليم)"""
+    found = []
+    errors = sum(harness.errors.values())
+    if errors:
+        found.append(f"{errors} ops raised errors")
+    if not consistency.get("readable"):
+        found.append("final state unreadable")
+        return found
+    for name in ("lost_updates", "unexpected_increments", "missing_seeded",
+                 "missing_created", "duplicate_keys", "wrong_device"):
+        if consistency[name]:
+            found.append(f"{name}={consistency[name]}")
+    return found
+
+def report(harness, elapsed, consistency):
+    attempts = sum(harness.attempts.values())
+    succeeded = sum(len(v) for v in harness.latency.values())
+    errors = sum(harness.errors.values())
+    rejected = sum(harness.rejected.values())
+    error_rate = errors / attempts if attempts else 0.0
+    print(
+        f"\n{succeeded} successful ops of {attempts} in {elapsed:.2f} s  ->  "
+        f"{succeeded / elapsed:,.0f} ops/s  (error rate {error_rate:.1%}, rejected {rejected})\n"
+    )
+    print(f"{'op':<10}{'ok':>8}{'errors':>8}{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for op in harness.ops:
+        values = sorted(harness.latency.get(op, []))
+        op_errors = sum(n for (name, _), n in harness.errors.items() if name == op)
+        if not values:
+            if op_errors:
+                print(f"{op:<10}{0:>8}{op_errors:>8}")
+            continue
+        print(
+            f"{op:<10}{len(values):>8}{op_errors:>8}{len(values) / elapsed:>10,.0f}"
+            f"{percentile(values, 50):>10.2f}{percentile(values, 95):>10.2f}"
+            f"{percentile(values, 99):>10.2f}{values[-1]:>10.2f}"
+        )
+
+    if harness.rejected:
+        print("\nrejected (LicenseError):")
+        for (op, reason), n in harness.rejected.most_common():
+            print(f"  {op:<10}{reason:<40}{n:>8}")
+    if harness.errors:
+        print("\nerrors:")
+        for (op, name), n in harness.errors.most_common():
+            print(f"  {op:<10}{name:<40}{n:>8}")
+
+    print("\nconsistency:")
+    for name, value in consistency.items():
+        print(f"  {name:<28}{value}")
+
+    found = problems(harness, consistency)
+    if found:
+        print("\nFAILED: " + "; ".join(found))
+    else:
+        print("\nOK")
+    return not found
+
+def main():
+    parser = argparse.ArgumentParser(description="license store concurrency benchmark")
+    parser.add_argument("--store", default="json", help="json أو module:Class")
+    parser.add_argument("--path", default=None, help="مسار التخزين (افتراضياً مجلد مؤقت)")
+    parser.add_argument("--licenses", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--ops", type=int, default=0, help="حد العمليات لكل thread (0 = بلا حد)")
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    ok = False
+    tmp_dir = None
+    path = args.path
+    if path is None:
+        tmp_dir = tempfile.mkdtemp(prefix="license_bench_")
+        path = os.path.join(tmp_dir, "licenses.json")
+
+    try:
+        store_class = load_store_class(args.store)
+        store = store_class(path)
+
+        t0 = time.perf_counter()
+        keys = seed_store(store, args.licenses)
+        print(f"{store_class.__name__} @ {path}")
+        print(f"seeded {len(keys)} licenses in {time.perf_counter() - t0:.2f} s")
+        print(f"threads={args.threads} seconds={args.seconds} mix={args.mix}")
+
+        harness = Harness(store, keys, args.mix, seed=args.seed)
+        elapsed = harness.run(args.threads, args.seconds, args.ops)
+        ok = report(harness, elapsed, harness.check())
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+مقارنة زمن ترميز الاستجابات الكبيرة: المسار الافتراضي في FastAPI
+(jsonable_encoder + json.dumps) مقابل fast_response (orjson / msgpack / gzip).
+تشغيل: python bench_serialize.py
+"""
+import gzip
+import json
+import time
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from fast_response import GZIP_LEVEL, msgpack
+
+EXPLANATION = (
+    "الإجابة الصحيحة لأن المفهوم يرتبط مباشرة بنواتج التعلم المستهدفة، "
+    "ويظهر ذلك من خلال تحليل المعطيات وربطها بالسياق العلمي للدرس"
+)
+
+def make_quiz(count=200):
+    return {
+        "questions": [
+            {
+                "q": f"السؤال رقم {i}: ما العامل الأكثر تأثيراً في نتائج التجربة الموصوفة؟",
+                "options": [f"الخيار {j} للسؤال {i}" for j in range(4)],
+                "answer": i % 4,
+                "explanations": [EXPLANATION] * 4,
+            }
+            for i in range(count)
+        ]
+    }
+
+def bench(name, fn, data, rounds=200):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        body = fn(data)
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"{name:<22} {elapsed * 1000:>8.3f} ms   {len(body):>8} bytes")
+
+def default_fastapi(data):
+    return json.dumps(
+        jsonable_encoder(data), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+if __name__ == "__main__":
+    quiz = make_quiz()
+
+    bench("jsonable+json.dumps", default_fastapi, quiz)
+    bench("orjson", orjson.dumps, quiz)
+    bench("orjson+gzip", lambda d: gzip.compress(orjson.dumps(d), compresslevel=GZIP_LEVEL), quiz)
+    if msgpack is not None:
+        bench("msgpack", lambda d: msgpack.packb(d, use_bin_type=True), quiz)
+        bench("msgpack+gzip", lambda d: gzip.compress(msgpack.packb(d, use_bin_type=True), compresslevel=GZIP_LEVEL), quiz)
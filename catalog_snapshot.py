@@ -0,0 +1,317 @@
+"""
+لقطة ثنائية (snapshot) للكتالوجات الثابتة (المعايير، التصنيفات، التقارير، القوائم...).
+
+خطوة البناء تقرأ ملف البيانات عبر ast (دون تنفيذه) وتكتب ملفاً واحداً:
+    python catalog_snapshot.py report_catalog_data.py report_catalog.snap
+
+التطبيق يفتح الملف عبر mmap للقراءة فقط، فتتشارك الـ workers نفس الصفحات،
+ولا يُفك ترميز أي سجل إلا عند طلبه.
+
+الصيغة (little-endian):
+    header : MAGIC | u16 version | 32 bytes sha256(source) | u32 n_catalogs
+    لكل كتالوج: u16 name_len | name | u8 kind | u32 count | u64 offsets_pos | u16 n_indexes
+                ثم لكل فهرس: u16 field_len | field | u64 index_pos
+    offsets   : (count + 1) × u64 مواقع سجلات JSON (UTF-8)
+    index     : u32 n | n × (u64 key_pos, u32 key_len, u32 record) مرتبة حسب المفتاح
+"""
+import ast
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+MAGIC = b"RCAT"
+FORMAT_VERSION = 1
+
+LIST = 0
+DICT = 1
+
+# الحقول التي يُبنى لها فهرس إن وُجدت في كل سجلات الكتالوج
+INDEX_FIELDS = ("id", "criterion_id", "subcategory_id")
+# مفتاح الفهرس لسجلات DICT (كل سجل [key, value])
+KEY_FIELD = "key"
+
+_HEADER = struct.Struct("<4sH32sI")
+_ENTRY = struct.Struct("<qII")   # key_pos, key_len, record
+
+class SnapshotError(Exception):
+    pass
+
+# =====================================================
+# البناء
+# =====================================================
+def _eval(node, env):
+    """literal_eval مع دعم a + b بين كتالوجات معرّفة سابقاً (مثل ALL_REPORTS)"""
+    if isinstance(node, ast.Name) and node.id in env:
+        return env[node.id]
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return _eval(node.left, env) + _eval(node.right, env)
+    return ast.literal_eval(node)
+
+def read_catalogs(source_path: str):
+    """كل تعريفات المستوى الأعلى NAME = [...] / {...} في ملف البيانات"""
+    with open(source_path, "rb") as f:
+        source = f.read()
+
+    catalogs = {}
+    for node in ast.parse(source).body:
+        if not (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)):
+            continue
+        try:
+            value = _eval(node.value, catalogs)
+        except ValueError:
+            continue
+        if isinstance(value, (list, dict)):
+            catalogs[node.targets[0].id] = value
+    return catalogs, hashlib.sha256(source).digest()
+
+def _encode(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def build(source_path: str, out_path: str):
+    catalogs, digest = read_catalogs(source_path)
+
+    # حساب حجم الترويسة أولاً لمعرفة مواقع البيانات
+    plans = []
+    header_size = _HEADER.size
+    for name, value in catalogs.items():
+        kind = DICT if isinstance(value, dict) else LIST
+        records = list(value.items()) if kind == DICT else value
+        if kind == DICT:
+            fields = [KEY_FIELD]
+        else:
+            fields = [f for f in INDEX_FIELDS
+                      if records and all(isinstance(r, dict) and f in r for r in records)]
+        plans.append((name, kind, records, fields))
+        header_size += 2 + len(name.encode("utf-8")) + 1 + 4 + 8 + 2
+        header_size += sum(2 + len(f) + 8 for f in fields)
+
+    body = bytearray()
+    entries = []
+    for name, kind, records, fields in plans:
+        blobs = [_encode(list(r) if kind == DICT else r) for r in records]
+
+        offsets_pos = header_size + len(body)
+        data_pos = offsets_pos + 8 * (len(blobs) + 1)
+        positions = [data_pos]
+        for blob in blobs:
+            positions.append(positions[-1] + len(blob))
+        body += struct.pack(f"<{len(positions)}q", *positions)
+        for blob in blobs:
+            body += blob
+
+        indexes = []
+        for field in fields:
+            keys = [
+                (str(r[0] if kind == DICT else r[field]).encode("utf-8"), i)
+                for i, r in enumerate(records)
+            ]
+            keys.sort()
+            index_pos = header_size + len(body)
+            keys_pos = index_pos + 4 + _ENTRY.size * len(keys)
+            body += struct.pack("<I", len(keys))
+            pos = keys_pos
+            for key, i in keys:
+                body += _ENTRY.pack(pos, len(key), i)
+                pos += len(key)
+            for key, _ in keys:
+                body += key
+            indexes.append((field, index_pos))
+
+        entries.append((name, kind, len(records), offsets_pos, indexes))
+
+    header = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, digest, len(entries)))
+    for name, kind, count, offsets_pos, indexes in entries:
+        raw = name.encode("utf-8")
+        header += struct.pack("<H", len(raw)) + raw
+        header += struct.pack("<BIqH", kind, count, offsets_pos, len(indexes))
+        for field, index_pos in indexes:
+            header += struct.pack("<H", len(field)) + field.encode("utf-8")
+            header += struct.pack("<q", index_pos)
+    assert len(header) == header_size
+
+    # ملف مؤقت فريد لكل عملية: عدة workers قد تبني اللقطة معاً عند أول تشغيل،
+    # وكل منها يستبدل الملف النهائي ذرياً بنسخة كاملة
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(out_path)),
+                                    prefix=os.path.basename(out_path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(body)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return len(header) + len(body)
+
+# =====================================================
+# القراءة
+# =====================================================
+class CatalogView:
+    """كتالوج داخل اللقطة: السجلات تُفك عند الوصول إليها فقط"""
+
+    def __init__(self, buf, name, kind, count, offsets_pos, indexes):
+        self._buf = buf
+        self.name = name
+        self.kind = kind
+        self.count = count
+        self._offsets_pos = offsets_pos
+        self._indexes = indexes
+
+    def __len__(self):
+        return self.count
+
+    def _span(self, i):
+        return struct.unpack_from("<2q", self._buf, self._offsets_pos + 8 * i)
+
+    def raw(self, i) -> bytes:
+        start, end = self._span(i)
+        return self._buf[start:end]
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        return json.loads(self.raw(i))
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self[i]
+
+    def all(self):
+        if self.kind == DICT:
+            return dict(self.items())
+        return list(self)
+
+    def raw_json(self) -> bytes:
+        """الكتالوج كاملاً كـ JSON دون فك أي سجل (لإرساله كما هو)"""
+        if self.kind == DICT:
+            return _encode(self.all())
+        return b"[" + b",".join(self.raw(i) for i in range(self.count)) + b"]"
+
+    def _range(self, field, value):
+        """[lo, hi) في فهرس field للقيمة value (بحث ثنائي على mmap)"""
+        index_pos = self._indexes.get(field)
+        if index_pos is None:
+            raise KeyError(f"{self.name} has no index on {field}")
+        n = struct.unpack_from("<I", self._buf, index_pos)[0]
+        base = index_pos + 4
+        target = str(value).encode("utf-8")
+
+        def key_at(j):
+            pos, length, _ = _ENTRY.unpack_from(self._buf, base + j * _ENTRY.size)
+            return self._buf[pos:pos + length]
+
+        lo, hi = 0, n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if key_at(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        end = lo
+        while end < n and key_at(end) == target:
+            end += 1
+        return base, lo, end
+
+    def where(self, field, value):
+        """كل السجلات التي field == value بترتيبها الأصلي"""
+        base, lo, end = self._range(field, value)
+        records = [_ENTRY.unpack_from(self._buf, base + j * _ENTRY.size)[2] for j in range(lo, end)]
+        return [self[i] for i in sorted(records)]
+
+    def find(self, field, value):
+        base, lo, end = self._range(field, value)
+        if lo == end:
+            return None
+        return self[_ENTRY.unpack_from(self._buf, base + lo * _ENTRY.size)[2]]
+
+    # ---------- DICT ----------
+    def get(self, key, default=None):
+        item = self.find(KEY_FIELD, key)
+        return item[1] if item is not None else default
+
+    def keys(self):
+        return [self[i][0] for i in range(self.count)]
+
+    def items(self):
+        for i in range(self.count):
+            yield tuple(self[i])
+
+class Snapshot:
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = self._mmap
+
+        magic, version, digest, n = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise SnapshotError(f"{path}: not a catalog snapshot")
+        if version != FORMAT_VERSION:
+            raise SnapshotError(f"{path}: format {version}, expected {FORMAT_VERSION}")
+        self.version = version
+        self.digest = digest
+
+        self.catalogs = {}
+        pos = _HEADER.size
+        for _ in range(n):
+            (name_len,) = struct.unpack_from("<H", buf, pos)
+            pos += 2
+            name = bytes(buf[pos:pos + name_len]).decode("utf-8")
+            pos += name_len
+            kind, count, offsets_pos, n_indexes = struct.unpack_from("<BIqH", buf, pos)
+            pos += struct.calcsize("<BIqH")
+            indexes = {}
+            for _ in range(n_indexes):
+                (field_len,) = struct.unpack_from("<H", buf, pos)
+                pos += 2
+                field = bytes(buf[pos:pos + field_len]).decode("utf-8")
+                pos += field_len
+                (indexes[field],) = struct.unpack_from("<q", buf, pos)
+                pos += 8
+            self.catalogs[name] = CatalogView(buf, name, kind, count, offsets_pos, indexes)
+
+    def __getitem__(self, name) -> CatalogView:
+        return self.catalogs[name]
+
+    def __contains__(self, name):
+        return name in self.catalogs
+
+    def close(self):
+        self.catalogs = {}
+        self._mmap.close()
+
+def load(snapshot_path: str, source_path: str = None) -> Snapshot:
+    """
+    فتح اللقطة؛ إن كانت غير موجودة أو أقدم من ملف البيانات (hash مختلف) تُبنى أولاً.
+    """
+    if source_path and os.path.exists(source_path):
+        with open(source_path, "rb") as f:
+            digest = hashlib.sha256(f.read()).digest()
+        try:
+            snapshot = Snapshot(snapshot_path)
+            if snapshot.digest == digest:
+                return snapshot
+            # لقطة قديمة: تحرير الـ mmap قبل استبدال الملف
+            snapshot.close()
+        except (OSError, SnapshotError, struct.error):
+            pass
+        build(source_path, snapshot_path)
+    return Snapshot(snapshot_path)
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("usage: python catalog_snapshot.py <source.py> <out.snap>")
+        sys.exit(1)
+    size = build(sys.argv[1], sys.argv[2])
+    snap = Snapshot(sys.argv[2])
+    print(f"{sys.argv[2]}: {size} bytes, {len(snap.catalogs)} catalogs")
+    for name, view in snap.catalogs.items():
+        print(f"  {name:<28} {len(view):>6} records  indexes={list(view._indexes)}")
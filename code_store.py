@@ -0,0 +1,114 @@
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+# ---------- Settings ----------
+DB_FILE = os.getenv("CODE_STORE_PATH", "codes.db")
+MAX_CODES = 100000
+MMAP_SIZE = 64 * 1024 * 1024
+# COUNT(*) يمسح الجدول كاملاً، فيُفحص الحجم كل SIZE_CHECK_EVERY إدراج فقط؛
+# قد يتجاوز الجدول max_codes مؤقتاً بما لا يزيد عن SIZE_CHECK_EVERY لكل worker
+SIZE_CHECK_EVERY = 256
+
+def _to_ts(dt: datetime) -> float:
+    return dt.replace(tzinfo=timezone.utc).timestamp()
+
+def _from_ts(ts: float) -> datetime:
+    return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None)
+
+class CodeStore:
+    """
+    تخزين أكواد التفعيل (code_hash -> expires_at) في SQLite مشترك بين كل الـ workers.
+    - البحث O(1) عبر المفتاح الأساسي.
+    - الأكواد المنتهية تُحذف بترتيب الانتهاء، والحجم محدود بـ max_codes.
+    يتصرف مثل dict (get / pop / [] / iter) ليحل محل VALID_CODES.
+    """
+
+    def __init__(self, path=DB_FILE, max_codes=MAX_CODES):
+        self.path = path
+        self.max_codes = max_codes
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._inserts = 0
+
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS activation_codes (
+                code_hash TEXT PRIMARY KEY,
+                expires_ts REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_codes_expires_ts ON activation_codes (expires_ts)")
+        conn.commit()
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout=10000")
+            conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+            self._local.conn = conn
+        return conn
+
+    def __setitem__(self, code_hash: str, expires_at: datetime):
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO activation_codes (code_hash, expires_ts) VALUES (?, ?)",
+                (code_hash, _to_ts(expires_at))
+            )
+            conn.execute("DELETE FROM activation_codes WHERE expires_ts < ?", (time.time(),))
+
+        with self._lock:
+            self._inserts += 1
+            check = self._inserts % SIZE_CHECK_EVERY == 0
+        if check:
+            self.enforce_limit()
+
+    def enforce_limit(self) -> int:
+        """تجاوز الحد: حذف الأقرب انتهاءً أولاً"""
+        conn = self._conn()
+        excess = len(self) - self.max_codes
+        if excess <= 0:
+            return 0
+        with conn:
+            conn.execute("""
+                DELETE FROM activation_codes WHERE code_hash IN (
+                    SELECT code_hash FROM activation_codes
+                    ORDER BY expires_ts
+                    LIMIT ?
+                )
+            """, (excess,))
+        return excess
+
+    def get(self, code_hash: str, default=None):
+        row = self._conn().execute(
+            "SELECT expires_ts FROM activation_codes WHERE code_hash = ?", (code_hash,)
+        ).fetchone()
+        return _from_ts(row[0]) if row else default
+
+    def pop(self, code_hash: str, default=None):
+        expires_at = self.get(code_hash)
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM activation_codes WHERE code_hash = ?", (code_hash,))
+        return expires_at if expires_at is not None else default
+
+    def purge_expired(self) -> int:
+        conn = self._conn()
+        with conn:
+            cur = conn.execute("DELETE FROM activation_codes WHERE expires_ts < ?", (time.time(),))
+        return cur.rowcount
+
+    def __contains__(self, code_hash: str) -> bool:
+        return self.get(code_hash) is not None
+
+    def __iter__(self):
+        rows = self._conn().execute("SELECT code_hash FROM activation_codes").fetchall()
+        return iter([r[0] for r in rows])
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM activation_codes").fetchone()[0]
@@ -1,10 +1,9 @@
 import uuid
 import datetime
-from database import SessionLocal, LicenseKey
+from database import get_session, LicenseKey
+from key_logic import license_filter
 
 def create_license(days=30, max_requests=1000):
-    db = SessionLocal()
-
     key_value = str(uuid.uuid4()).replace("-", "").upper()
     expires_at = datetime.datetime.utcnow() + datetime.timedelta(days=days)
 
@@ -16,10 +15,11 @@ def create_license(days=30, max_requests=1000):
         is_active=True
     )
 
-    db.add(license_key)
-    db.commit()
-    db.close()
+    with get_session() as db:
+        db.add(license_key)
+        db.commit()
 
+    license_filter.add(key_value)
     return key_value, expires_at, max_requests
 
 if __name__ == "__main__":
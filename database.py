@@ -1,17 +1,37 @@
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime
+from contextlib import contextmanager
+from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, and_
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base, sessionmaker
 import datetime
 
 DATABASE_URL = "sqlite:///licenses.db"
+# يحتاج sqlalchemy[asyncio] (greenlet) و aiosqlite، انظر requirements.txt
+ASYNC_DATABASE_URL = "sqlite+aiosqlite:///licenses.db"
 
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False}
 )
 
+async_engine = create_async_engine(ASYNC_DATABASE_URL)
+
 SessionLocal = sessionmaker(bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 Base = declarative_base()
 
+@contextmanager
+def get_session():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_session():
+    # FastAPI dependency: Depends(get_async_session)؛ الجلسة تُغلق دائماً بعد الطلب
+    async with AsyncSessionLocal() as session:
+        yield session
+
 class LicenseKey(Base):
     __tablename__ = "license_keys"
 
@@ -29,4 +49,30 @@ class LicenseKey(Base):
             and datetime.datetime.utcnow() < self.expires_at
         )
 
+    @classmethod
+    def valid_filter(cls, now=None):
+        # نفس شروط is_valid لكن كشرط SQL
+        now = now or datetime.datetime.utcnow()
+        return and_(
+            cls.is_active.is_(True),
+            cls.used_requests < cls.max_requests,
+            cls.expires_at > now
+        )
+
+class AccessKey(Base):
+    __tablename__ = "access_keys"
+
+    id = Column(Integer, primary_key=True)
+    key_hash = Column(String, unique=True, index=True)
+    expires_at = Column(DateTime)
+    is_active = Column(Boolean, default=True)
+
+    @classmethod
+    def valid_filter(cls, now=None):
+        now = now or datetime.datetime.utcnow()
+        return and_(
+            cls.is_active.is_(True),
+            cls.expires_at > now
+        )
+
 Base.metadata.create_all(engine)
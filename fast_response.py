@@ -0,0 +1,41 @@
+import gzip
+
+import orjson
+from fastapi import Request
+from fastapi.responses import Response
+
+from server_timing import phase
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# ---------- Settings ----------
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 5
+
+JSON_TYPE = "application/json"
+MSGPACK_TYPE = "application/msgpack"
+
+def encode(content, accept: str = ""):
+    """يعيد (body, media_type) حسب Accept: msgpack إن طُلب وتوفرت المكتبة، وإلا JSON عبر orjson"""
+    if msgpack is not None and MSGPACK_TYPE in accept:
+        return msgpack.packb(content, use_bin_type=True, default=str), MSGPACK_TYPE
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS), JSON_TYPE
+
+def respond(request: Request, content, status_code: int = 200, headers: dict = None) -> Response:
+    """
+    استجابة سريعة للبيانات الداخلية الموثوقة (dict/list من أنواع JSON الأساسية):
+    تتجاوز jsonable_encoder، وتُضغط gzip إذا تجاوزت GZIP_MIN_BYTES وقبلها العميل.
+    """
+    with phase("serialize"):
+        body, media_type = encode(content, request.headers.get("accept", ""))
+        headers = dict(headers or {})
+        headers["Vary"] = "Accept, Accept-Encoding"
+
+        if len(body) >= GZIP_MIN_BYTES and "gzip" in request.headers.get("accept-encoding", ""):
+            body = gzip.compress(body, compresslevel=GZIP_LEVEL)
+            headers["Content-Encoding"] = "gzip"
+
+    return Response(content=body, status_code=status_code, media_type=media_type, headers=headers)
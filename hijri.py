@@ -0,0 +1,102 @@
+from datetime import date
+
+# ---------- Umm al-Qura table ----------
+# طول كل شهر هجري (28 + الرقم) من محرم 1343 إلى ذي الحجة 1500
+# المصدر: جداول تقويم أم القرى الرسمية
+FIRST_YEAR = 1343
+LAST_YEAR = 1500
+FIRST_DAY = date(1924, 8, 1)  # 1 محرم 1343
+
+MONTH_LENGTHS = (
+    "212212220222" "112121212121" "212131202212" "112212211221" "112212212211" "212121221130"
+    "212121222032" "121211212212" "212121112212" "212121212121" "212212122112" "121212212121"
+    "212121212212" "112121221121" "212121212122" "221211211221" "222121121121" "212121212122"
+    "212121212121" "212121212121" "212121212122" "212121202221" "212121212122" "212121212121"
+    "212121212121" "212121212122" "212121221221" "212121212121" "212112121222" "121212112122"
+    "121212121212" "212121221122" "212121211221" "121122212121" "211212122122" "212121212121"
+    "121212121212" "212121212121" "212212112121" "212212211212" "121221212121" "212121212121"
+    "212211212221" "221121212122" "112121212122" "122121212121" "212121212122" "212121221211"
+    "212121212122" "112121212122" "212111212122" "212121211221" "212212112121" "212221211212"
+    "121221212121" "212121221212" "121212121221" "221211212122" "121212112121" "222121211212"
+    "122212121121" "122122212112" "112212212121" "212121212212" "121212121212" "212121211212"
+    "212212121121" "212221212112" "121221221211" "211221222121" "121122122122" "112112122212"
+    "121211212212" "212121211212" "212122121211" "212122212121" "121212212212" "121121222212"
+    "112111222212" "211211122212" "212121121212" "212212112121" "212212122121" "121212212212"
+    "112121221221" "211211222122" "121121122122" "122112121212" "122121212112" "122212121211"
+    "212212212121" "121212212211" "212121212212" "121212121212" "212211212112" "212221121121"
+    "212221212112" "121222121211" "212122122121" "121212122121" "212121212122" "121221121212"
+    "122212112112" "122212211211" "212221212121" "121221221212" "112121221221" "212112121221"
+    "221211212121" "222121121212" "122211212121" "122212121212" "112212122121" "211212122212"
+    "121121122122" "212112112212" "221211211221" "221212121122" "121221212121" "212121212212"
+    "121121221221" "212112121222" "121211211222" "212121121212" "212212112121" "212212121212"
+    "112212212211" "211221212221" "121121221221" "212121121221" "212212112121" "221221211212"
+    "121222121121" "121222122112" "112122122211" "211212212212" "121121212212" "122112121212"
+    "122122121121" "212212212112" "112212221211" "211221221221" "121122121222" "112121212122"
+    "121212112122" "122121211212" "122212121121" "212212212112" "121212212122" "112121212212"
+    "211212112212" "221121121212" "221212112121" "222121211212" "122122112121" "212122121212"
+    "121212121221" "221121121222"
+)
+
+# بداية كل شهر كرقم يوم (date.toordinal) — تُحسب مرة واحدة
+MONTH_STARTS = [FIRST_DAY.toordinal()]
+for _d in MONTH_LENGTHS:
+    MONTH_STARTS.append(MONTH_STARTS[-1] + 28 + int(_d))
+
+LAST_DAY = date.fromordinal(MONTH_STARTS[-1] - 1)
+_MEAN_MONTH = (MONTH_STARTS[-1] - MONTH_STARTS[0]) / len(MONTH_LENGTHS)
+
+# ---------- Digits ----------
+ARABIC_DIGITS = "٠١٢٣٤٥٦٧٨٩"
+TO_ARABIC_DIGITS = str.maketrans("0123456789", ARABIC_DIGITS)
+TO_LATIN_DIGITS = str.maketrans(ARABIC_DIGITS + "۰۱۲۳۴۵۶۷۸۹", "0123456789" * 2)
+
+def to_arabic_digits(text: str) -> str:
+    return text.translate(TO_ARABIC_DIGITS)
+
+def to_latin_digits(text: str) -> str:
+    return text.translate(TO_LATIN_DIGITS)
+
+def parse_date(text: str):
+    """'1447/08/28' أو '١٤٤٧/٠٨/٢٨' -> (1447, 8, 28)"""
+    parts = to_latin_digits(text).strip().replace("-", "/").split("/")
+    if len(parts) != 3:
+        raise ValueError("صيغة التاريخ غير صحيحة. استخدم: YYYY/MM/DD")
+    return tuple(int(p) for p in parts)
+
+# ---------- Conversion ----------
+def month_length(year: int, month: int) -> int:
+    if not FIRST_YEAR <= year <= LAST_YEAR or not 1 <= month <= 12:
+        raise ValueError("التاريخ الهجري خارج النطاق المدعوم (1343–1500)")
+    return 28 + int(MONTH_LENGTHS[(year - FIRST_YEAR) * 12 + month - 1])
+
+def hijri_to_gregorian(year: int, month: int, day: int) -> date:
+    if not 1 <= day <= month_length(year, month):
+        raise ValueError("اليوم غير صحيح لهذا الشهر الهجري")
+    index = (year - FIRST_YEAR) * 12 + month - 1
+    return date.fromordinal(MONTH_STARTS[index] + day - 1)
+
+def gregorian_to_hijri(value: date):
+    ordinal = value.toordinal()
+    if not MONTH_STARTS[0] <= ordinal < MONTH_STARTS[-1]:
+        raise ValueError("التاريخ الميلادي خارج النطاق المدعوم (1924–2077)")
+
+    # تقدير مباشر ثم تصحيح بخطوة أو خطوتين (O(1))
+    index = min(int((ordinal - MONTH_STARTS[0]) / _MEAN_MONTH), len(MONTH_LENGTHS) - 1)
+    while MONTH_STARTS[index] > ordinal:
+        index -= 1
+    while MONTH_STARTS[index + 1] <= ordinal:
+        index += 1
+
+    year, month = divmod(index, 12)
+    return FIRST_YEAR + year, month + 1, ordinal - MONTH_STARTS[index] + 1
+
+# ---------- Today (cached) ----------
+_today = {"date": None, "hijri": None}
+
+def today_hijri():
+    """(gregorian date, (y, m, d)) — يُعاد حسابه فقط عند تغيّر اليوم"""
+    current = date.today()
+    if _today["date"] != current:
+        _today["hijri"] = gregorian_to_hijri(current)
+        _today["date"] = current
+    return current, _today["hijri"]
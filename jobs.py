@@ -0,0 +1,261 @@
+import asyncio
+import atexit
+import hashlib
+import json
+import os
+import secrets
+import socket
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+# ---------- Settings ----------
+DB_FILE = os.getenv("JOBS_STORE_PATH", "jobs.db")
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+MAX_QUEUED_JOBS = int(os.getenv("MAX_QUEUED_JOBS", "100"))
+RESULT_TTL = int(os.getenv("JOB_RESULT_TTL", str(24 * 3600)))
+POLL_INTERVAL = 1.0
+# كل عملية تحدّث heartbeat مهامها دورياً؛ المهمة التي لم يُحدّث نبضها خلال JOB_STALE_AFTER
+# تُعد يتيمة (توقفت عمليتها) وتُعلّم failed من أي عملية أخرى تشارك نفس القاعدة
+HEARTBEAT_INTERVAL = float(os.getenv("JOB_HEARTBEAT_INTERVAL", "15"))
+STALE_AFTER = float(os.getenv("JOB_STALE_AFTER", "60"))
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+FINISHED = (DONE, FAILED)
+
+class JobQueueFull(Exception):
+    pass
+
+def _pack(data) -> bytes:
+    return zlib.compress(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+def _unpack(blob):
+    return json.loads(zlib.decompress(blob).decode("utf-8")) if blob else None
+
+def owner_hash(secret: str) -> str:
+    return hashlib.sha256(secret.encode()).hexdigest()
+
+class JobManager:
+    """
+    تشغيل المهام الطويلة (دفعات الأسئلة / التقارير) في الخلفية.
+    - عدد الـ workers محدود، والطابور محدود بـ max_queued.
+    - النتائج الجزئية والنهائية تُحفظ في SQLite وتبقى RESULT_TTL ثانية.
+    - كل مهمة مسجلة باسم العملية التي تنفذها (worker) مع نبض دوري؛ عدة workers
+      (أو main.py و main taraf) يمكنها مشاركة نفس jobs.db.
+    - المهام التي توقف نبضها (عمليتها انتهت) تُعلّم failed مع الاحتفاظ بالجزء المنجز،
+      دون المساس بمهام العمليات الأخرى الحية.
+    """
+
+    def __init__(self, path=DB_FILE, workers=JOB_WORKERS, max_queued=MAX_QUEUED_JOBS,
+                 result_ttl=RESULT_TTL, heartbeat_interval=HEARTBEAT_INTERVAL,
+                 stale_after=STALE_AFTER):
+        self.path = path
+        self.max_queued = max_queued
+        self.result_ttl = result_ttl
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        # pid وحده قد يتكرر بعد إعادة التشغيل، فيُضاف له رمز عشوائي لكل تشغيل
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(4)}"
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._active = 0
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                done INTEGER NOT NULL DEFAULT 0,
+                total INTEGER NOT NULL DEFAULT 0,
+                result BLOB,
+                error TEXT,
+                created_ts REAL NOT NULL,
+                updated_ts REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_updated_ts ON jobs (updated_ts);
+        """)
+        # قواعد أُنشئت قبل إضافة worker / heartbeat_ts
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+        with conn:
+            if "worker" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN worker TEXT")
+            if "heartbeat_ts" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN heartbeat_ts REAL")
+        self.sweep_stale()
+        self.purge_expired()
+
+        self._stop = threading.Event()
+        threading.Thread(target=self._heartbeat_loop, name="job-heartbeat", daemon=True).start()
+        atexit.register(self._stop.set)
+        atexit.register(self._pool.shutdown, wait=False)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout=10000")
+            self._local.conn = conn
+        return conn
+
+    def _update(self, job_id, **fields):
+        fields["updated_ts"] = time.time()
+        columns = ", ".join(f"{k} = ?" for k in fields)
+        conn = self._conn()
+        with conn:
+            conn.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+
+    def _heartbeat_loop(self):
+        while not self._stop.wait(self.heartbeat_interval):
+            try:
+                conn = self._conn()
+                with conn:
+                    conn.execute(
+                        "UPDATE jobs SET heartbeat_ts = ? WHERE worker = ? AND status IN (?, ?)",
+                        (time.time(), self.worker_id, QUEUED, RUNNING)
+                    )
+                self.sweep_stale()
+            except sqlite3.Error:
+                # القاعدة مشغولة مؤقتاً؛ المحاولة التالية بعد heartbeat_interval
+                pass
+
+    def sweep_stale(self) -> int:
+        """تعليم مهام العمليات المتوقفة failed (لا تتأثر مهام العمليات الحية)"""
+        now = time.time()
+        conn = self._conn()
+        with conn:
+            cur = conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_ts = ? "
+                "WHERE status IN (?, ?) AND COALESCE(heartbeat_ts, updated_ts) < ?",
+                (FAILED, "Interrupted by server restart", now,
+                 QUEUED, RUNNING, now - self.stale_after)
+            )
+        return cur.rowcount
+
+    def has_capacity(self) -> bool:
+        return self._active < self.max_queued
+
+    def reserve(self):
+        """
+        حجز مكان في الطابور قبل خصم الترخيص؛ يرفع JobQueueFull.
+        بعدها إما submit(..., reserved=True) أو release().
+        """
+        with self._lock:
+            if self._active >= self.max_queued:
+                raise JobQueueFull()
+            self._active += 1
+
+    def release(self):
+        with self._lock:
+            self._active -= 1
+
+    def submit(self, owner: str, kind: str, total: int, fn, reserved: bool = False) -> str:
+        """
+        fn(progress) يعيد النتيجة النهائية (قابلة للتحويل إلى JSON).
+        progress(partial, done) يحفظ النتيجة الجزئية أثناء التنفيذ.
+        """
+        if not reserved:
+            self.reserve()
+
+        try:
+            self.purge_expired()
+            job_id = secrets.token_urlsafe(12)
+            ts = time.time()
+            conn = self._conn()
+            with conn:
+                conn.execute(
+                    "INSERT INTO jobs (id, owner, kind, status, total, created_ts, updated_ts, "
+                    "worker, heartbeat_ts) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (job_id, owner, kind, QUEUED, total, ts, ts, self.worker_id, ts)
+                )
+            self._pool.submit(self._run, job_id, fn)
+        except BaseException:
+            self.release()
+            raise
+        return job_id
+
+    def _run(self, job_id, fn):
+        try:
+            self._update(job_id, status=RUNNING)
+
+            def progress(partial, done):
+                self._update(job_id, result=_pack(partial), done=done)
+
+            result = fn(progress)
+            self._update(job_id, status=DONE, result=_pack(result))
+        except Exception as e:
+            detail = getattr(e, "detail", None) or str(e)
+            self._update(job_id, status=FAILED, error=str(detail))
+        finally:
+            self.release()
+
+    def get(self, job_id: str, owner: str = None):
+        row = self._conn().execute(
+            "SELECT id, owner, kind, status, done, total, result, error, created_ts, updated_ts "
+            "FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        if not row or (owner is not None and row[1] != owner):
+            return None
+        if row[3] in FINISHED and row[9] < time.time() - self.result_ttl:
+            return None
+
+        return {
+            "job_id": row[0],
+            "kind": row[2],
+            "status": row[3],
+            "done": row[4],
+            "total": row[5],
+            "result": _unpack(row[6]),
+            "error": row[7],
+            "created_at": row[8],
+            "updated_at": row[9],
+        }
+
+    async def events(self, job_id: str, owner: str = None, interval=POLL_INTERVAL):
+        """تدفق SSE: حدث عند كل تغيّر في التقدم، ثم حدث أخير عند الانتهاء"""
+        last = None
+        while True:
+            # SQLite متزامن: القراءة في thread حتى لا تُوقف حلقة الأحداث لكل تدفق مفتوح
+            job = await asyncio.to_thread(self.get, job_id, owner)
+            if job is None:
+                yield "event: error\ndata: {\"detail\": \"Job not found\"}\n\n"
+                return
+
+            state = (job["status"], job["done"])
+            if state != last:
+                last = state
+                event = "result" if job["status"] in FINISHED else "progress"
+                if event == "progress":
+                    job = {k: v for k, v in job.items() if k != "result"}
+                yield f"event: {event}\ndata: {json.dumps(job, ensure_ascii=False)}\n\n"
+                if event == "result":
+                    return
+
+            await asyncio.sleep(interval)
+
+    def purge_expired(self) -> int:
+        conn = self._conn()
+        with conn:
+            cur = conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_ts < ?",
+                (*FINISHED, time.time() - self.result_ttl)
+            )
+        return cur.rowcount
+
+    def stats(self):
+        rows = self._conn().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {
+            "worker": self.worker_id,
+            "active": self._active,
+            "max_queued": self.max_queued,
+            "result_ttl": self.result_ttl,
+            "by_status": dict(rows),
+        }
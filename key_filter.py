@@ -0,0 +1,172 @@
+import hashlib
+import math
+import threading
+import time
+
+# ---------- Settings ----------
+DEFAULT_CAPACITY = 100000
+DEFAULT_ERROR_RATE = 0.001
+# كل كم ثانية يُفحص version() في الخلفية (مفاتيح أنشأها worker آخر)
+REFRESH_SECONDS = 5
+# دون version(): إعادة بناء كاملة في الخلفية بهذا الفاصل
+FULL_REFRESH_SECONDS = 300
+
+class KeyFilter:
+    """
+    Counting Bloom filter لمفاتيح/أكواد صالحة.
+    - لا يوجد false negative: أي مفتاح تمت إضافته يمر دائماً.
+    - المفتاح غير الموجود يُرفض من الذاكرة دون لمس القاعدة.
+    loader (اختياري) يعيد جميع المفاتيح الصالحة من التخزين.
+    الرفض لا يعيد البناء أبداً (حتى لا تُسبب مفاتيح عشوائية مسحاً كاملاً للتخزين)؛
+    المفاتيح الجديدة تدخل عبر add() في نفس العملية، وعبر thread خلفي للعمليات الأخرى:
+    كل refresh_seconds يُستدعى version() (قيمة رخيصة تتغير مع الإضافة، مثل MAX(id))
+    ويُعاد البناء فقط إن تغيّرت، ودون version كل FULL_REFRESH_SECONDS.
+    """
+
+    def __init__(self, loader=None, capacity=DEFAULT_CAPACITY, error_rate=DEFAULT_ERROR_RATE,
+                 refresh_seconds=REFRESH_SECONDS, version=None):
+        self.loader = loader
+        self.version = version
+        self.error_rate = error_rate
+        self.refresh_seconds = refresh_seconds
+        self.rejected = 0
+        self.passed = 0
+        self._lock = threading.Lock()
+        self._rebuild_lock = threading.Lock()
+        self._built_at = 0.0
+        self._built = False
+        self._version = None
+        self._pending = None    # مفاتيح أضيفت أثناء rebuild (تُطبق على المصفوفة الجديدة)
+        self.items = 0
+        self._state = self._empty(capacity)
+
+        if loader and refresh_seconds:
+            threading.Thread(target=self._refresh_loop, name="key-filter", daemon=True).start()
+
+    def _empty(self, capacity):
+        """(capacity, size, hashes, counts) لمصفوفة جديدة فارغة"""
+        capacity = max(int(capacity), 1)
+        size = max(int(-capacity * math.log(self.error_rate) / (math.log(2) ** 2)), 8)
+        hashes = max(int(round(size / capacity * math.log(2))), 1)
+        return capacity, size, hashes, bytearray(size)
+
+    # الحالة تُستبدل كاملة بإسناد واحد، فالقارئ يرى دائماً مصفوفة مكتملة ومتسقة
+    capacity = property(lambda self: self._state[0])
+    size = property(lambda self: self._state[1])
+    hashes = property(lambda self: self._state[2])
+
+    @staticmethod
+    def _indexes(key: str, size: int, hashes: int):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % size for i in range(hashes)]
+
+    @classmethod
+    def _increment(cls, state, key: str):
+        _, size, hashes, counts = state
+        for i in cls._indexes(key, size, hashes):
+            if counts[i] < 255:
+                counts[i] += 1
+
+    def add(self, key: str):
+        with self._lock:
+            self._increment(self._state, key)
+            self.items += 1
+            if self._pending is not None:
+                self._pending.append(key)
+
+    def remove(self, key: str):
+        """يُستدعى فقط لمفتاح حُذف فعلاً من التخزين (وإلا تُنقص عدادات مفاتيح أخرى)"""
+        if key not in self:
+            return
+        with self._lock:
+            _, size, hashes, counts = self._state
+            for i in self._indexes(key, size, hashes):
+                # العدّاد المشبع (255) لا يُنقص حتى لا ينتج false negative
+                if 0 < counts[i] < 255:
+                    counts[i] -= 1
+            self.items = max(self.items - 1, 0)
+
+    def __contains__(self, key: str) -> bool:
+        _, size, hashes, counts = self._state
+        return all(counts[i] for i in self._indexes(key, size, hashes))
+
+    def rebuild(self, keys=None, if_unbuilt=False):
+        """بناء مصفوفة جديدة محلياً ثم استبدالها دفعة واحدة (دون نافذة false negative)"""
+        with self._rebuild_lock:
+            # أول فحص قبل أي بناء: طلبات متزامنة تنتظر بناءً واحداً
+            if if_unbuilt and self._built:
+                return
+            self._rebuild(keys)
+
+    def _refresh_loop(self):
+        while True:
+            time.sleep(self.refresh_seconds)
+            try:
+                if self.version is not None:
+                    if self._built and self.version() == self._version:
+                        continue
+                elif time.monotonic() - self._built_at < FULL_REFRESH_SECONDS:
+                    continue
+                self.rebuild()
+            except Exception:
+                # التخزين غير متاح مؤقتاً: تبقى المصفوفة الحالية وتُعاد المحاولة لاحقاً
+                pass
+
+    def _rebuild(self, keys):
+        with self._lock:
+            self._pending = []
+        version = self._version
+        try:
+            if keys is None:
+                # الإصدار قبل القراءة: أي إضافة أثناءها تُغيّره فيُعاد البناء لاحقاً
+                version = self.version() if self.version else None
+                keys = list(self.loader()) if self.loader else []
+            capacity = self.capacity
+            if len(keys) > capacity:
+                capacity = len(keys) * 2
+            state = self._empty(capacity)
+            for key in keys:
+                self._increment(state, key)
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+
+        with self._lock:
+            # ما أُضيف أثناء القراءة من التخزين قد لا يكون في keys
+            for key in self._pending:
+                self._increment(state, key)
+            self._state = state
+            self.items = len(keys) + len(self._pending)
+            self._pending = None
+        self._version = version
+        self._built_at = time.monotonic()
+        self._built = True
+
+    def check(self, key: str) -> bool:
+        if not self._built and self.loader:
+            # البناء الأول فقط؛ بعده لا يؤدي الرفض إلى أي قراءة من التخزين
+            self.rebuild(if_unbuilt=True)
+        if key in self:
+            self.passed += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def false_positive_rate(self) -> float:
+        return (1 - math.exp(-self.hashes * self.items / self.size)) ** self.hashes
+
+    def stats(self):
+        return {
+            "items": self.items,
+            "capacity": self.capacity,
+            "hashes": self.hashes,
+            "counters": self.size,
+            "memory_bytes": len(self._state[3]),
+            "false_positive_rate": self.false_positive_rate(),
+            "target_error_rate": self.error_rate,
+            "passed": self.passed,
+            "rejected": self.rejected,
+        }
@@ -1,18 +1,75 @@
-import datetime
 from fastapi import HTTPException
-from database import SessionLocal, AccessKey
+from sqlalchemy import func, select
+from database import get_session, AsyncSessionLocal, AccessKey, LicenseKey
 from security import hash_key
+from key_filter import KeyFilter
 
-def validate_time_key(access_key: str):
-    db = SessionLocal()
-    key_hash = hash_key(access_key)
+def _load_access_hashes():
+    with get_session() as db:
+        return [h for (h,) in db.execute(select(AccessKey.key_hash))]
+
+def _load_license_keys():
+    with get_session() as db:
+        return [k for (k,) in db.execute(select(LicenseKey.key))]
+
+def _max_id(model):
+    # يتغير مع كل إضافة (من أي worker)، فيُعاد بناء الفلتر عندها فقط
+    with get_session() as db:
+        return db.execute(select(func.max(model.id))).scalar()
 
-    key = db.query(AccessKey).filter_by(key_hash=key_hash).first()
+access_filter = KeyFilter(loader=_load_access_hashes, version=lambda: _max_id(AccessKey))
+access_filter.rebuild()
+license_filter = KeyFilter(loader=_load_license_keys, version=lambda: _max_id(LicenseKey))
+license_filter.rebuild()
 
-    if not key or not key.is_active:
+def _lookup_query(access_key: str):
+    # استعلام واحد على الفهرس، أعمدة فقط دون تحميل كائن ORM؛
+    # valid يحسب شرط الصلاحية في SQL ليبقى التمييز بين "غير صالح" و"منتهي"
+    return (
+        select(AccessKey.id, AccessKey.expires_at, AccessKey.valid_filter().label("valid"))
+        .where(AccessKey.key_hash == hash_key(access_key))
+        .where(AccessKey.is_active.is_(True))
+    )
+
+def _check(row):
+    """{"id", "expires_at"} للمفتاح الصالح، وإلا 403"""
+    if not row:
         raise HTTPException(status_code=403, detail="Invalid access key")
 
-    if datetime.datetime.utcnow() > key.expires_at:
+    if not row.valid:
         raise HTTPException(status_code=403, detail="Access key expired")
 
-    return key
+    return {"id": row.id, "expires_at": row.expires_at}
+
+def validate_time_key(access_key: str):
+    if not access_filter.check(hash_key(access_key)):
+        _check(None)
+    with get_session() as db:
+        row = db.execute(_lookup_query(access_key)).first()
+    return _check(row)
+
+async def validate_time_key_async(access_key: str):
+    if not access_filter.check(hash_key(access_key)):
+        _check(None)
+    async with AsyncSessionLocal() as db:
+        row = (await db.execute(_lookup_query(access_key))).first()
+    return _check(row)
+
+def _license_query(key_value: str):
+    return (
+        select(LicenseKey.id)
+        .where(LicenseKey.key == key_value)
+        .where(LicenseKey.valid_filter())
+    )
+
+def is_license_valid(key_value: str) -> bool:
+    if not license_filter.check(key_value):
+        return False
+    with get_session() as db:
+        return db.execute(_license_query(key_value)).first() is not None
+
+async def is_license_valid_async(key_value: str) -> bool:
+    if not license_filter.check(key_value):
+        return False
+    async with AsyncSessionLocal() as db:
+        return (await db.execute(_license_query(key_value))).first() is not None
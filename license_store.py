@@ -0,0 +1,132 @@
+import json
+import os
+import secrets
+from datetime import datetime, timedelta
+
+DB_FILE = "licenses.json"
+
+class LicenseError(Exception):
+    """رفض الترخيص؛ الرسالة هي نفس detail المرسل للعميل"""
+    pass
+
+def now():
+    return datetime.utcnow()
+
+class JsonLicenseStore:
+    """
+    تخزين التراخيص في ملف JSON واحد (السلوك الأصلي لـ main.py).
+    كل عملية تقرأ الملف كاملاً ثم تكتبه كاملاً، دون أقفال.
+
+    أي تخزين بديل يجب أن يوفر نفس الدوال:
+        create / validate / get / list / update / reset_device / delete
+    ليعمل مع main.py ومع bench_license_store.py.
+    """
+
+    def __init__(self, path=DB_FILE):
+        self.path = path
+
+    def load_db(self):
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save_db(self, data):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def create(self, days=30, max_requests=1000, owner="", max_tokens=None) -> str:
+        db = self.load_db()
+        key = "ST-" + secrets.token_hex(6).upper()
+        db.append({
+            "license_key": key,
+            "expires_at": (now() + timedelta(days=days)).isoformat(),
+            "max_requests": max_requests,
+            "max_tokens": max_tokens,
+            "used_requests": 0,
+            "bound_device": None,
+            "is_active": True,
+            "owner": owner,
+            "created_at": now().isoformat(),
+            "last_request_at": None
+        })
+        self.save_db(db)
+        return key
+
+    def validate(self, license_key, device_id, check=None):
+        """
+        التحقق من الترخيص وخصم طلب واحد.
+        check(record) اختياري لشروط إضافية (مثل حد التوكنات) ويرفع LicenseError.
+        """
+        db = self.load_db()
+        for l in db:
+            if l["license_key"] == license_key:
+                if not l["is_active"]:
+                    raise LicenseError("License disabled")
+                if now() > datetime.fromisoformat(l["expires_at"]):
+                    raise LicenseError("License expired")
+                if l["used_requests"] >= l["max_requests"]:
+                    raise LicenseError("Limit reached")
+                if check:
+                    check(l)
+
+                if l["bound_device"] is None:
+                    l["bound_device"] = device_id
+                elif l["bound_device"] != device_id:
+                    raise LicenseError("License used on another device")
+
+                l["used_requests"] += 1
+                l["last_request_at"] = now().isoformat()
+                self.save_db(db)
+                return
+        raise LicenseError("Invalid license")
+
+    def get(self, key):
+        for l in self.load_db():
+            if l["license_key"] == key:
+                return l
+        return None
+
+    def list(self):
+        return self.load_db()
+
+    def version(self):
+        """قيمة رخيصة تتغير مع كل كتابة للملف (لتحديث KeyFilter في الخلفية)"""
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def update(self, key, days=None, max_requests=None, max_tokens=None, is_active=None) -> bool:
+        db = self.load_db()
+        for l in db:
+            if l["license_key"] == key:
+                if days is not None:
+                    l["expires_at"] = (now() + timedelta(days=days)).isoformat()
+                if max_requests is not None:
+                    l["max_requests"] = max_requests
+                if max_tokens is not None:
+                    l["max_tokens"] = max_tokens or None
+                if is_active is not None:
+                    l["is_active"] = is_active
+                self.save_db(db)
+                return True
+        return False
+
+    def reset_device(self, key) -> bool:
+        db = self.load_db()
+        for l in db:
+            if l["license_key"] == key:
+                l["bound_device"] = None
+                self.save_db(db)
+                return True
+        return False
+
+    def delete(self, key) -> bool:
+        """True إذا كان الترخيص موجوداً وحُذف"""
+        db = self.load_db()
+        kept = [l for l in db if l["license_key"] != key]
+        if len(kept) == len(db):
+            return False
+        self.save_db(kept)
+        return True
@@ -1,13 +1,32 @@
-import os, json, math, itertools, secrets
-from datetime import datetime, timedelta
-from fastapi import FastAPI, HTTPException, Header
+import os, math, asyncio
+from fastapi import FastAPI, HTTPException, Header, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-import google.generativeai as genai
+from key_filter import KeyFilter
+from model_pool import ModelPool
+from model_router import ModelRouter, DEFAULT_MODEL
+from jobs import JobManager, JobQueueFull, owner_hash
+from admission import Admission
+from fast_response import respond
+from metering import Meter
+from quiz_json import parse_questions
+from question_bank import QuestionBank
+from license_store import JsonLicenseStore, LicenseError
+from server_timing import ServerTimingMiddleware, phase
 
-MODEL = "gemini-2.5-flash-lite"
 BATCH_SIZE = 10
 MAX_TOTAL = 200
+# طلبات إضافية مسموحة لتعويض الأسئلة غير الصالحة فقط
+MAX_REFILLS = 3
+
+# حد الطلبات لكل ترخيص/جهاز (طلب في الدقيقة، رصيد أقصى)
+LICENSE_RATE = float(os.getenv("LICENSE_RATE_PER_MIN", "6"))
+LICENSE_BURST = int(os.getenv("LICENSE_BURST", "3"))
+
+# أقصى طلبات Gemini جارية في الـ worker (المسار async لا يحجز thread أثناء الانتظار)
+GENERATION_CONCURRENCY = int(os.getenv("GENERATION_CONCURRENCY", "256"))
 
 ADMIN_SECRET = os.getenv("ADMIN_SECRET")
 if not ADMIN_SECRET:
@@ -18,34 +37,28 @@ keys = [k for k in keys if k]
 if not keys:
     raise RuntimeError("No Gemini API keys found")
 
-key_cycle = itertools.cycle(keys)
-
-def get_model():
-    genai.configure(api_key=next(key_cycle))
-    return genai.GenerativeModel(MODEL)
+# عداد التوكنات لكل ترخيص ولكل مفتاح
+meter = Meter()
+model_pool = ModelPool(keys, DEFAULT_MODEL,
+                       on_response=lambda label, res: meter.record("key", label, res))
+model_router = ModelRouter()
+# كل طلب ينتظر نداء نموذج واحداً في كل لحظة، فحد القبول = سعة التوليد async
+admission = Admission(key_count=len(keys), max_in_flight=GENERATION_CONCURRENCY)
+generation_slots = asyncio.BoundedSemaphore(GENERATION_CONCURRENCY)
 
 DB_FILE = "licenses.json"
+license_store = JsonLicenseStore(DB_FILE)
 
-def load_db():
-    if not os.path.exists(DB_FILE):
-        return []
-    with open(DB_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+# مفاتيح الترخيص الصالحة في الذاكرة لرفض المفاتيح الخاطئة دون قراءة الملف
+license_filter = KeyFilter(loader=lambda: [l["license_key"] for l in license_store.list()],
+                           version=license_store.version)
+license_filter.rebuild()
 
-def save_db(data):
-    with open(DB_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+# مهام التوليد الطويلة في الخلفية
+job_manager = JobManager()
 
-def now():
-    return datetime.utcnow()
-
-def safe_json(text: str):
-    try:
-        s = text.find("{")
-        e = text.rfind("}") + 1
-        return json.loads(text[s:e])
-    except:
-        return None
+# أسئلة مولدة سابقاً تُعاد لأجهزة لم ترها
+question_bank = QuestionBank()
 
 def build_prompt(topic, lang, count):
     return f"""
@@ -77,6 +90,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ServerTimingMiddleware)
 
 class GenerateReq(BaseModel):
     topic: str
@@ -86,34 +100,28 @@ class GenerateReq(BaseModel):
 class CreateLicense(BaseModel):
     days: int = 30
     max_requests: int = 1000
+    max_tokens: int | None = None
     owner: str = ""
 
 class UpdateLicense(BaseModel):
     days: int | None = None
     max_requests: int | None = None
+    max_tokens: int | None = None
     is_active: bool | None = None
 
 def validate_license(license_key, device_id):
-    db = load_db()
-    for l in db:
-        if l["license_key"] == license_key:
-            if not l["is_active"]:
-                raise HTTPException(403, "License disabled")
-            if now() > datetime.fromisoformat(l["expires_at"]):
-                raise HTTPException(403, "License expired")
-            if l["used_requests"] >= l["max_requests"]:
-                raise HTTPException(403, "Limit reached")
-
-            if l["bound_device"] is None:
-                l["bound_device"] = device_id
-            elif l["bound_device"] != device_id:
-                raise HTTPException(403, "License used on another device")
-
-            l["used_requests"] += 1
-            l["last_request_at"] = now().isoformat()
-            save_db(db)
-            return
-    raise HTTPException(403, "Invalid license")
+    if not license_filter.check(license_key):
+        raise HTTPException(403, "Invalid license")
+
+    def token_check(l):
+        if l.get("max_tokens") and meter.totals("license", license_key)["total_tokens"] >= l["max_tokens"]:
+            raise LicenseError("Token limit reached")
+
+    try:
+        with phase("license"):
+            license_store.validate(license_key, device_id, check=token_check)
+    except LicenseError as e:
+        raise HTTPException(403, str(e))
 
 def admin_check(key):
     if key != ADMIN_SECRET:
@@ -123,81 +131,208 @@ def admin_check(key):
 def root():
     return {"status": "ok"}
 
-@app.post("/generate/batch")
-def generate(req: GenerateReq,
-             license_key: str = Header(...),
-             device_id: str = Header(...)):
-    validate_license(license_key, device_id)
-
+def take_batch(res, need, seen):
+    """الأسئلة الصالحة الجديدة من رد واحد (حتى need)"""
+    with phase("parse"):
+        fresh = [q for q in parse_questions(res.text) if q["q"] not in seen][:need]
+    seen.update(q["q"] for q in fresh)
+    return fresh
+
+async def generate_questions(req: GenerateReq, progress=None, license_key: str = None, device_id: str = None):
+    """
+    توليد دفعة أسئلة: من البنك أولاً (أسئلة لم يرها هذا الجهاز)، والنقص فقط يُولد.
+    انتظار النموذج داخل حلقة الأحداث، والتخزين (بنك الأسئلة / progress) في الـ threadpool.
+    مسار المهام الخلفية يشغّلها على نفس الحلقة عبر run_on_loop.
+    """
     total = min(req.total_questions, MAX_TOTAL)
-    batches = math.ceil(total / BATCH_SIZE)
-    out = []
 
-    for _ in range(batches):
-        need = min(BATCH_SIZE, total - len(out))
-        model = get_model()
-        res = model.generate_content(build_prompt(req.topic, req.language, need))
-        data = safe_json(res.text)
-        if not data:
-            raise HTTPException(500, "Model error")
-        out.extend(data["questions"][:need])
+    with phase("bank"):
+        out = await run_in_threadpool(question_bank.sample, req.topic, req.language, device_id, total) if device_id else []
+    banked = len(out)
+    if progress and banked:
+        await run_in_threadpool(progress, {"questions": out, "models": []}, banked)
+
+    batches = math.ceil((total - banked) / BATCH_SIZE)
+    models = []
+    seen = {q["q"] for q in out}
+    calls = 0
+    completed = False
+
+    try:
+        while len(out) < total:
+            if calls >= batches + MAX_REFILLS:
+                raise HTTPException(500, "Model error")
+            calls += 1
+
+            need = min(BATCH_SIZE, total - len(out))
+            prompt = build_prompt(req.topic, req.language, need)
+            async with generation_slots:
+                res, model = await model_router.generate_async(
+                    "quiz_batch", lambda m: model_pool.generate_content_async(prompt, model=m)
+                )
+            if license_key:
+                meter.record("license", license_key, res)
+            # الأسئلة الصالحة تُحفظ؛ الناقص فقط يُطلب في الدورة التالية
+            out.extend(take_batch(res, need, seen))
+            models.append(model)
+            if progress:
+                await run_in_threadpool(progress, {"questions": out, "models": models}, len(out))
+        completed = True
+    finally:
+        # ما تولد يُضاف للبنك حتى لو فشل الطلب في منتصفه؛
+        # أسئلة البنك تُسجل كمرئية فقط إذا وصلت للجهاز (نجح الطلب)
+        with phase("bank"):
+            await run_in_threadpool(question_bank.add, req.topic, req.language, out[banked:], device_id,
+                                    delivered=out[:banked] if completed else ())
+
+    return {"questions": out, "models": models, "from_bank": banked}
+
+def run_on_loop(loop, coro):
+    """
+    تشغيل coroutine من thread مهمة خلفية على حلقة الخادم وانتظار نتيجتها.
+    عملاء Gemini async و generation_slots مرتبطة بهذه الحلقة، فلا يصلح asyncio.run.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+@app.post("/generate/batch")
+async def generate(req: GenerateReq,
+                   request: Request,
+                   license_key: str = Header(...),
+                   device_id: str = Header(...)):
+    with admission.admit(f"{license_key}:{device_id}", LICENSE_RATE, LICENSE_BURST):
+        await run_in_threadpool(validate_license, license_key, device_id)
+        result = await generate_questions(req, license_key=license_key, device_id=device_id)
+        return respond(request, result)
+
+@app.post("/jobs/batch", status_code=202)
+async def submit_batch_job(req: GenerateReq,
+                           license_key: str = Header(...),
+                           device_id: str = Header(...)):
+    # حجز مكان في الطابور قبل خصم الترخيص، حتى لا يُخصم طلب ثم يُرفض لامتلاء الطابور
+    try:
+        job_manager.reserve()
+    except JobQueueFull:
+        raise HTTPException(503, "Job queue full", headers={"Retry-After": "10"})
 
-    return {"questions": out}
+    try:
+        # المهمة تعمل لاحقاً داخل مجمع محدود؛ هنا يُطبق حد المعدل فقط
+        admission.limit(f"{license_key}:{device_id}", LICENSE_RATE, LICENSE_BURST)
+        await run_in_threadpool(validate_license, license_key, device_id)
+    except BaseException:
+        job_manager.release()
+        raise
+
+    loop = asyncio.get_running_loop()
+    job_id = await run_in_threadpool(
+        job_manager.submit,
+        owner=owner_hash(license_key),
+        kind="batch",
+        total=min(req.total_questions, MAX_TOTAL),
+        fn=lambda progress: run_on_loop(loop, generate_questions(req, progress, license_key, device_id)),
+        reserved=True
+    )
+
+    return {"job_id": job_id, "status": "queued"}
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str, request: Request, license_key: str = Header(...)):
+    job = job_manager.get(job_id, owner_hash(license_key))
+    if not job:
+        raise HTTPException(404, "Job not found")
+    return respond(request, job)
+
+@app.get("/jobs/{job_id}/events")
+def job_events(job_id: str, license_key: str = Header(...)):
+    owner = owner_hash(license_key)
+    if not job_manager.get(job_id, owner):
+        raise HTTPException(404, "Job not found")
+    return StreamingResponse(
+        job_manager.events(job_id, owner),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
 
 @app.post("/admin/create")
 def admin_create(data: CreateLicense, x_admin_key: str = Header(...)):
     admin_check(x_admin_key)
-    db = load_db()
-    key = "ST-" + secrets.token_hex(6).upper()
-    db.append({
-        "license_key": key,
-        "expires_at": (now() + timedelta(days=data.days)).isoformat(),
-        "max_requests": data.max_requests,
-        "used_requests": 0,
-        "bound_device": None,
-        "is_active": True,
-        "owner": data.owner,
-        "created_at": now().isoformat(),
-        "last_request_at": None
-    })
-    save_db(db)
+    key = license_store.create(
+        days=data.days,
+        max_requests=data.max_requests,
+        owner=data.owner,
+        max_tokens=data.max_tokens
+    )
+    license_filter.add(key)
     return {"license_key": key}
 
 @app.get("/admin/licenses")
-def admin_list(x_admin_key: str = Header(...)):
+def admin_list(request: Request, x_admin_key: str = Header(...)):
     admin_check(x_admin_key)
-    return load_db()
+    return respond(request, license_store.list())
 
 @app.put("/admin/update/{key}")
 def admin_update(key: str, data: UpdateLicense, x_admin_key: str = Header(...)):
     admin_check(x_admin_key)
-    db = load_db()
-    for l in db:
-        if l["license_key"] == key:
-            if data.days is not None:
-                l["expires_at"] = (now() + timedelta(days=data.days)).isoformat()
-            if data.max_requests is not None:
-                l["max_requests"] = data.max_requests
-            if data.is_active is not None:
-                l["is_active"] = data.is_active
-            save_db(db)
-            return {"status": "updated"}
+    if license_store.update(
+        key,
+        days=data.days,
+        max_requests=data.max_requests,
+        max_tokens=data.max_tokens,
+        is_active=data.is_active
+    ):
+        return {"status": "updated"}
     raise HTTPException(404, "Not found")
 
 @app.post("/admin/reset-device/{key}")
 def admin_reset(key: str, x_admin_key: str = Header(...)):
     admin_check(x_admin_key)
-    db = load_db()
-    for l in db:
-        if l["license_key"] == key:
-            l["bound_device"] = None
-            save_db(db)
-            return {"status": "reset"}
+    if license_store.reset_device(key):
+        return {"status": "reset"}
     raise HTTPException(404, "Not found")
 
 @app.delete("/admin/delete/{key}")
 def admin_delete(key: str, x_admin_key: str = Header(...)):
     admin_check(x_admin_key)
-    db = [l for l in load_db() if l["license_key"] != key]
-    save_db(db)
+    # الحذف من الفلتر فقط لمفتاح كان موجوداً (وإلا تُنقص عدادات مفاتيح أخرى)
+    if license_store.delete(key):
+        license_filter.remove(key)
     return {"status": "deleted"}
+
+@app.get("/admin/jobs")
+def admin_jobs(x_admin_key: str = Header(...)):
+    admin_check(x_admin_key)
+    return job_manager.stats()
+
+@app.get("/admin/question-bank")
+def admin_question_bank(x_admin_key: str = Header(...)):
+    admin_check(x_admin_key)
+    return question_bank.stats()
+
+@app.get("/admin/usage")
+def admin_usage(scope: str = "license", limit: int = 50, x_admin_key: str = Header(...)):
+    admin_check(x_admin_key)
+    return meter.top(scope, min(max(limit, 1), 500))
+
+@app.get("/admin/usage/{key}")
+def admin_license_usage(key: str, x_admin_key: str = Header(...)):
+    admin_check(x_admin_key)
+    return meter.totals("license", key)
+
+@app.get("/admin/model-router")
+def admin_model_router(x_admin_key: str = Header(...)):
+    admin_check(x_admin_key)
+    return model_router.stats()
+
+@app.get("/admin/model-pool")
+def admin_model_pool(x_admin_key: str = Header(...)):
+    admin_check(x_admin_key)
+    return model_pool.stats()
+
+@app.get("/admin/admission")
+def admin_admission(x_admin_key: str = Header(...)):
+    admin_check(x_admin_key)
+    return admission.stats()
+
+@app.get("/admin/key-filter")
+def admin_key_filter(x_admin_key: str = Header(...)):
+    admin_check(x_admin_key)
+    return license_filter.stats()
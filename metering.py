@@ -0,0 +1,135 @@
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+# ---------- Settings ----------
+DB_FILE = os.getenv("METERING_PATH", "metering.db")
+FLUSH_INTERVAL = 5.0
+
+FIELDS = ("requests", "prompt_tokens", "output_tokens", "total_tokens")
+
+def usage_of(response) -> dict:
+    """التوكنات من usage_metadata في استجابة Gemini (أصفار إن لم تتوفر)"""
+    meta = getattr(response, "usage_metadata", None)
+    prompt = getattr(meta, "prompt_token_count", 0) or 0
+    output = getattr(meta, "candidates_token_count", 0) or 0
+    total = getattr(meta, "total_token_count", 0) or prompt + output
+    return {"prompt_tokens": prompt, "output_tokens": output, "total_tokens": total}
+
+class Meter:
+    """
+    عداد استهلاك التوكنات لكل (scope, subject): scope مثل license / code / key.
+    التجميع في الذاكرة، والكتابة إلى SQLite دفعة واحدة كل FLUSH_INTERVAL.
+    """
+
+    def __init__(self, path=DB_FILE, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = {}    # (scope, subject) -> [requests, prompt, output, total]
+
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS usage_tallies (
+                scope TEXT NOT NULL,
+                subject TEXT NOT NULL,
+                requests INTEGER NOT NULL DEFAULT 0,
+                prompt_tokens INTEGER NOT NULL DEFAULT 0,
+                output_tokens INTEGER NOT NULL DEFAULT 0,
+                total_tokens INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (scope, subject)
+            ) WITHOUT ROWID
+        """)
+        conn.commit()
+
+        threading.Thread(target=self._run, daemon=True).start()
+        atexit.register(self.flush)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            self._local.conn = conn
+        return conn
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except sqlite3.Error:
+                pass
+
+    def record(self, scope: str, subject, response=None, usage: dict = None):
+        """تسجيل طلب واحد مع توكناته (من response أو usage جاهز)"""
+        usage = usage or usage_of(response)
+        key = (scope, str(subject))
+        with self._lock:
+            tally = self._pending.get(key)
+            if tally is None:
+                tally = self._pending[key] = [0, 0, 0, 0]
+            tally[0] += 1
+            tally[1] += usage["prompt_tokens"]
+            tally[2] += usage["output_tokens"]
+            tally[3] += usage["total_tokens"]
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return
+
+            now = datetime.utcnow().isoformat()
+            try:
+                conn = self._conn()
+                with conn:
+                    conn.executemany("""
+                        INSERT INTO usage_tallies
+                            (scope, subject, requests, prompt_tokens, output_tokens, total_tokens, updated_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT (scope, subject) DO UPDATE SET
+                            requests = requests + excluded.requests,
+                            prompt_tokens = prompt_tokens + excluded.prompt_tokens,
+                            output_tokens = output_tokens + excluded.output_tokens,
+                            total_tokens = total_tokens + excluded.total_tokens,
+                            updated_at = excluded.updated_at
+                    """, [(scope, subject, *tally, now) for (scope, subject), tally in pending.items()])
+            except sqlite3.Error:
+                # إعادة الأرقام للذاكرة حتى لا تضيع
+                with self._lock:
+                    for key, tally in pending.items():
+                        current = self._pending.setdefault(key, [0, 0, 0, 0])
+                        for i, value in enumerate(tally):
+                            current[i] += value
+                raise
+
+    def totals(self, scope: str, subject) -> dict:
+        """الإجمالي المحفوظ + غير المكتوب بعد"""
+        subject = str(subject)
+        row = self._conn().execute(
+            "SELECT requests, prompt_tokens, output_tokens, total_tokens FROM usage_tallies "
+            "WHERE scope = ? AND subject = ?", (scope, subject)
+        ).fetchone() or (0, 0, 0, 0)
+        with self._lock:
+            pending = self._pending.get((scope, subject), (0, 0, 0, 0))
+        return {field: row[i] + pending[i] for i, field in enumerate(FIELDS)}
+
+    def top(self, scope: str, limit: int = 50):
+        self.flush()
+        rows = self._conn().execute(
+            "SELECT subject, requests, prompt_tokens, output_tokens, total_tokens, updated_at "
+            "FROM usage_tallies WHERE scope = ? ORDER BY total_tokens DESC LIMIT ?",
+            (scope, limit)
+        ).fetchall()
+        return [
+            {"subject": r[0], **dict(zip(FIELDS, r[1:5])), "updated_at": r[5]}
+            for r in rows
+        ]
@@ -0,0 +1,338 @@
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import google.generativeai as genai
+from google.ai import generativelanguage as glm
+
+# ---------- Settings ----------
+HEDGE_BUDGET = float(os.getenv("HEDGE_BUDGET", "0.1"))        # نسبة الطلبات المكررة المسموحة
+FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURES", "3"))   # فشل متتالٍ يفتح القاطع
+OPEN_SECONDS = float(os.getenv("BREAKER_OPEN_SECONDS", "30"))
+DEFAULT_HEDGE_AFTER = 8.0       # قبل تجمع عينات كافية لحساب p95
+MIN_SAMPLES = 20
+WINDOW = 200
+CALL_TIMEOUT = 120.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class NoHealthyKey(Exception):
+    pass
+
+def _bind(name: str, attr: str, client):
+    """
+    GenerativeModel بعميل محدد بدل العميل العام (genai.configure).
+    المكتبة لا توفر ذلك علناً، فيُضبط الحقل الخاص _client / _async_client
+    (موجود في google-generativeai 0.8.x، والإصدار مثبت في requirements.txt).
+    هذا هو الموضع الوحيد الذي يعتمد على تفاصيل المكتبة الداخلية.
+    """
+    model = genai.GenerativeModel(name)
+    if not hasattr(model, attr):
+        raise RuntimeError(f"google-generativeai: GenerativeModel.{attr} not found; check the pinned version")
+    setattr(model, attr, client)
+    return model
+
+class KeyState:
+    def __init__(self, key: str):
+        self.key = key
+        self.label = f"...{key[-4:]}"
+        self.latencies = deque(maxlen=WINDOW)
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.calls = 0
+        self.errors = 0
+
+        # عميل مستقل لكل مفتاح: genai.configure عام ولا يصلح لطلبات متوازية بمفاتيح مختلفة
+        self.client = glm.GenerativeServiceClient(client_options={"api_key": key})
+        self.models = {}
+        # العميل async يُنشأ داخل حلقة الأحداث عند أول طلب async
+        self.async_client = None
+        self.async_models = {}
+
+    def model(self, name: str):
+        if name not in self.models:
+            self.models[name] = _bind(name, "_client", self.client)
+        return self.models[name]
+
+    def async_model(self, name: str):
+        if self.async_client is None:
+            self.async_client = glm.GenerativeServiceAsyncClient(client_options={"api_key": self.key})
+        if name not in self.async_models:
+            self.async_models[name] = _bind(name, "_async_client", self.async_client)
+        return self.async_models[name]
+
+    def p95(self):
+        if len(self.latencies) < MIN_SAMPLES:
+            return DEFAULT_HEDGE_AFTER
+        ordered = sorted(self.latencies)
+        return ordered[int(len(ordered) * 0.95) - 1]
+
+    def stats(self):
+        return {
+            "key": self.label,
+            "state": self.state,
+            "failures": self.failures,
+            "calls": self.calls,
+            "errors": self.errors,
+            "p95": round(self.p95(), 3),
+            "samples": len(self.latencies),
+        }
+
+class ModelPool:
+    """
+    توزيع الطلبات على مفاتيح Gemini مع:
+    - circuit breaker لكل مفتاح (closed / open / half_open).
+    - hedging: إن تجاوز الطلب p95 للمفتاح يُرسل طلب مكرر لمفتاح آخر ويؤخذ أول رد ناجح،
+      بشرط ألا تتجاوز الطلبات المكررة HEDGE_BUDGET من إجمالي الطلبات.
+    """
+
+    def __init__(self, keys, model_name: str, workers: int = 32, on_response=None):
+        self.model_name = model_name
+        self.on_response = on_response   # on_response(key_label, response) لعد التوكنات لكل مفتاح
+        self.keys = [KeyState(k) for k in keys]
+        self._next = 0
+        self._lock = threading.Lock()
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gemini")
+        self._busy = 0   # طلبات متزامنة تشغل thread الآن (منها الخاسرة في الـ hedging)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    # ---------- Breaker ----------
+    def _available(self, ks: KeyState, now: float) -> bool:
+        if ks.state == CLOSED:
+            return True
+        if ks.state == OPEN and now - ks.opened_at >= OPEN_SECONDS:
+            ks.state = HALF_OPEN
+            ks.probing = False
+        if ks.state == HALF_OPEN and not ks.probing:
+            ks.probing = True   # طلب تجريبي واحد فقط
+            return True
+        return False
+
+    def _pick(self, exclude=None):
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.keys)):
+                ks = self.keys[self._next % len(self.keys)]
+                self._next += 1
+                if ks is not exclude and self._available(ks, now):
+                    return ks
+        return None
+
+    def _record(self, ks: KeyState, latency: float, ok: bool):
+        with self._lock:
+            ks.calls += 1
+            ks.probing = False
+            if ok:
+                ks.latencies.append(latency)
+                ks.failures = 0
+                ks.state = CLOSED
+                return
+            ks.errors += 1
+            ks.failures += 1
+            if ks.state == HALF_OPEN or ks.failures >= FAILURE_THRESHOLD:
+                ks.state = OPEN
+                ks.opened_at = time.monotonic()
+
+    # ---------- Calls ----------
+    def _call(self, ks: KeyState, prompt, model, **kwargs):
+        start = time.monotonic()
+        with self._lock:
+            self._busy += 1
+        try:
+            response = ks.model(model).generate_content(prompt, **kwargs)
+            response.text   # يرفع خطأ إذا حُجب الرد أو كان فارغاً
+        except Exception:
+            self._record(ks, time.monotonic() - start, False)
+            raise
+        finally:
+            with self._lock:
+                self._busy -= 1
+        self._record(ks, time.monotonic() - start, True)
+        if self.on_response:
+            self.on_response(ks.label, response)
+        return response
+
+    def _can_hedge(self, sync: bool = False) -> bool:
+        with self._lock:
+            if sync and self._busy >= self.workers:
+                # لا thread فارغ: الطلب المكرر سينتظر في الطابور ولن يسبق الأصلي
+                return False
+            return self.hedges < HEDGE_BUDGET * self.requests
+
+    def generate_content(self, prompt, model: str = None, **kwargs):
+        model = model or self.model_name
+        primary = self._pick()
+        if primary is None:
+            raise NoHealthyKey("All Gemini keys are unavailable")
+
+        with self._lock:
+            self.requests += 1
+
+        # الطلب المتزامن لا يمكن إلغاؤه بعد بدئه، فالخاسر في الـ hedging يشغل thread
+        # حتى ينتهي؛ المهلة تحد ذلك بـ CALL_TIMEOUT بدل مهلة المكتبة الافتراضية
+        kwargs.setdefault("request_options", {"timeout": CALL_TIMEOUT})
+        first = self._executor.submit(self._call, primary, prompt, model, **kwargs)
+        pending = {first}
+        try:
+            return first.result(timeout=primary.p95())
+        except Exception as e:
+            if first.done() and first.exception() is None:
+                return first.result()
+            error = e if first.done() else None
+
+        # بطيء (تجاوز p95) أو فشل: محاولة على مفتاح آخر
+        backup = self._pick(exclude=primary) if error is not None or self._can_hedge(sync=True) else None
+        hedged = backup is not None and error is None
+        if hedged:
+            with self._lock:
+                self.hedges += 1
+        if backup is not None:
+            pending.add(self._executor.submit(self._call, backup, prompt, model, **kwargs))
+        if error is not None:
+            pending.discard(first)
+
+        deadline = time.monotonic() + CALL_TIMEOUT
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=max(deadline - time.monotonic(), 0),
+                                     return_when=FIRST_COMPLETED)
+                if not done:
+                    raise TimeoutError("Gemini call timed out")
+                for future in done:
+                    if future.exception() is None:
+                        if hedged and future is not first:
+                            with self._lock:
+                                self.hedge_wins += 1
+                        return future.result()
+                    error = future.exception()
+            raise error
+        finally:
+            # ما لم يبدأ بعد يُلغى من الطابور
+            for future in pending:
+                future.cancel()
+
+    # ---------- Async ----------
+    async def _call_async(self, ks: KeyState, prompt, model, **kwargs):
+        start = time.monotonic()
+        try:
+            response = await ks.async_model(model).generate_content_async(prompt, **kwargs)
+            response.text
+        except asyncio.CancelledError:
+            # طلب خاسر في الـ hedging أو انقطع العميل: ليس فشلاً للمفتاح
+            with self._lock:
+                ks.probing = False
+            raise
+        except Exception:
+            self._record(ks, time.monotonic() - start, False)
+            raise
+        self._record(ks, time.monotonic() - start, True)
+        if self.on_response:
+            self.on_response(ks.label, response)
+        return response
+
+    async def generate_content_async(self, prompt, model: str = None, **kwargs):
+        """
+        نفس generate_content لكن دون حجز thread طوال الطلب:
+        الانتظار والـ hedging داخل حلقة الأحداث، والطلب الخاسر يُلغى.
+        """
+        model = model or self.model_name
+        primary = self._pick()
+        if primary is None:
+            raise NoHealthyKey("All Gemini keys are unavailable")
+
+        with self._lock:
+            self.requests += 1
+
+        first = asyncio.ensure_future(self._call_async(primary, prompt, model, **kwargs))
+        tasks = [first]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=primary.p95())
+            error = None
+            if done:
+                if first.exception() is None:
+                    return first.result()
+                error = first.exception()
+
+            backup = self._pick(exclude=primary) if error is not None or self._can_hedge() else None
+            hedged = backup is not None and error is None
+            if hedged:
+                with self._lock:
+                    self.hedges += 1
+
+            pending = set() if error is not None else {first}
+            if backup is not None:
+                second = asyncio.ensure_future(self._call_async(backup, prompt, model, **kwargs))
+                tasks.append(second)
+                pending.add(second)
+
+            deadline = time.monotonic() + CALL_TIMEOUT
+            while pending:
+                done, pending = await asyncio.wait(pending, timeout=max(deadline - time.monotonic(), 0),
+                                                   return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    raise TimeoutError("Gemini call timed out")
+                for task in done:
+                    if task.exception() is None:
+                        if hedged and task is not first:
+                            with self._lock:
+                                self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def stream_async(self, prompt, model: str = None, **kwargs):
+        """
+        أجزاء النص أثناء توليدها (stream=True). لا hedging هنا:
+        الرد المتدفق لا يمكن استبداله بعد بدء إرساله للعميل.
+        """
+        model = model or self.model_name
+        ks = self._pick()
+        if ks is None:
+            raise NoHealthyKey("All Gemini keys are unavailable")
+
+        with self._lock:
+            self.requests += 1
+
+        start = time.monotonic()
+        try:
+            response = await ks.async_model(model).generate_content_async(prompt, stream=True, **kwargs)
+            async for chunk in response:
+                text = chunk.text
+                if text:
+                    yield text
+        except (asyncio.CancelledError, GeneratorExit):
+            with self._lock:
+                ks.probing = False
+            raise
+        except Exception:
+            self._record(ks, time.monotonic() - start, False)
+            raise
+        self._record(ks, time.monotonic() - start, True)
+        if self.on_response:
+            self.on_response(ks.label, response)
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_rate": self.hedges / self.requests if self.requests else 0.0,
+            "hedge_wins": self.hedge_wins,
+            "hedge_budget": HEDGE_BUDGET,
+            "busy_workers": self._busy,
+            "workers": self.workers,
+            "keys": [ks.stats() for ks in self.keys],
+        }
@@ -0,0 +1,219 @@
+import os
+import threading
+import time
+from collections import deque
+
+from server_timing import mark
+
+# ---------- Models ----------
+# التكلفة بالدولار لكل مليون توكن (إدخال، إخراج)
+MODELS = {
+    "gemini-2.5-flash-lite": {"cost": (0.10, 0.40)},
+    "gemini-2.0-flash":      {"cost": (0.10, 0.40)},
+    "gemini-2.5-flash":      {"cost": (0.30, 2.50)},
+}
+
+# ---------- Routes ----------
+# models: المرشحة بترتيب الجودة، max_latency: أقصى متوسط زمن مقبول (ثوانٍ)،
+# max_cost: أقصى تكلفة (إدخال + إخراج) لكل مليون توكن
+ROUTES = {
+    "quiz_batch": {"models": ["gemini-2.5-flash-lite", "gemini-2.0-flash"], "max_latency": 20, "max_cost": 0.5},
+    "report":     {"models": ["gemini-2.5-flash-lite", "gemini-2.5-flash"], "max_latency": 30, "max_cost": 3.0},
+    "ask":        {"models": ["gemini-2.5-flash-lite", "gemini-2.0-flash"], "max_latency": 20, "max_cost": 0.5},
+}
+
+DEFAULT_MODEL = os.getenv("DEFAULT_GEMINI_MODEL", "gemini-2.5-flash-lite")
+WINDOW = 50
+MAX_ERROR_RATE = 0.5
+# النموذج المتأخر بسبب الأخطاء لا يُجرب تقريباً، فلا تتجدد نافذته؛
+# لذلك تُهمل النتائج الأقدم من ERROR_DECAY_SECONDS ويعود للترتيب الطبيعي
+ERROR_DECAY_SECONDS = float(os.getenv("MODEL_ERROR_DECAY", "300"))
+THROTTLE_SECONDS = 60
+
+class AllModelsFailed(Exception):
+    pass
+
+def is_throttled(error: Exception) -> bool:
+    # google.api_core.exceptions.ResourceExhausted (429) دون الاعتماد على المكتبة مباشرة
+    return type(error).__name__ in ("ResourceExhausted", "TooManyRequests") or "429" in str(error)
+
+class ModelHealth:
+    def __init__(self):
+        self.latencies = deque(maxlen=WINDOW)
+        self.outcomes = deque(maxlen=WINDOW)   # (monotonic, True = نجاح)
+        self.throttled_until = 0.0
+        self.calls = 0
+
+    def latency(self):
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+    def error_rate(self, now=None):
+        since = (now or time.monotonic()) - ERROR_DECAY_SECONDS
+        recent = [ok for ts, ok in self.outcomes if ts >= since]
+        return recent.count(False) / len(recent) if recent else 0.0
+
+class ModelRouter:
+    """
+    اختيار النموذج لكل نوع طلب (quiz_batch / report / ask):
+    - يُؤخر النموذج المقيد (429) لمدة THROTTLE_SECONDS أو الذي تتجاوز أخطاؤه MAX_ERROR_RATE.
+    - يُختار الأعلى جودة ضمن max_latency و max_cost، ثم الأسرع من الباقي.
+    - عند الفشل ينتقل الطلب تلقائياً للنموذج التالي.
+    """
+
+    def __init__(self, routes=ROUTES, models=MODELS):
+        self.routes = routes
+        self.models = models
+        self.health = {name: ModelHealth() for name in models}
+        self.chosen = {cls: {} for cls in routes}   # class -> model -> count
+        self._lock = threading.Lock()
+
+    def _cost(self, name):
+        return sum(self.models.get(name, {}).get("cost", (0, 0)))
+
+    def candidates(self, request_class: str):
+        """النماذج مرتبة حسب أولوية التجربة لهذا الطلب"""
+        route = self.routes.get(request_class)
+        if not route:
+            return [DEFAULT_MODEL]
+
+        now = time.monotonic()
+        healthy, degraded = [], []
+        for name in route["models"]:
+            h = self.health.setdefault(name, ModelHealth())
+            if h.throttled_until > now or h.error_rate(now) > MAX_ERROR_RATE:
+                degraded.append(name)
+            else:
+                healthy.append(name)
+
+        max_cost = route.get("max_cost", float("inf"))
+        fast = [n for n in healthy
+                if self.health[n].latency() <= route["max_latency"] and self._cost(n) <= max_cost]
+        slow = [n for n in healthy if n not in fast]
+        slow.sort(key=lambda n: self.health[n].latency())
+        degraded.sort(key=lambda n: self.health[n].throttled_until)
+        return fast + slow + degraded
+
+    def record(self, name: str, latency: float, ok: bool, throttled: bool = False):
+        with self._lock:
+            h = self.health.setdefault(name, ModelHealth())
+            h.calls += 1
+            h.outcomes.append((time.monotonic(), ok))
+            if ok:
+                h.latencies.append(latency)
+            if throttled:
+                h.throttled_until = time.monotonic() + THROTTLE_SECONDS
+
+    def generate(self, request_class: str, call):
+        """
+        call(model_name) ينفذ الطلب ويعيد الاستجابة.
+        يعيد (response, model_name) لتسجيل النموذج المستخدم مع الطلب.
+        """
+        error = None
+        for name in self.candidates(request_class):
+            start = time.monotonic()
+            try:
+                response = call(name)
+            except Exception as e:
+                elapsed = time.monotonic() - start
+                mark("model", elapsed * 1000)
+                self.record(name, elapsed, False, is_throttled(e))
+                error = e
+                continue
+
+            elapsed = time.monotonic() - start
+            mark("model", elapsed * 1000)
+            self.record(name, elapsed, True)
+            with self._lock:
+                counts = self.chosen.setdefault(request_class, {})
+                counts[name] = counts.get(name, 0) + 1
+            return response, name
+
+        raise error or AllModelsFailed(request_class)
+
+    async def generate_async(self, request_class: str, call):
+        """مثل generate، لكن call(model_name) يعيد coroutine"""
+        error = None
+        for name in self.candidates(request_class):
+            start = time.monotonic()
+            try:
+                response = await call(name)
+            except Exception as e:
+                elapsed = time.monotonic() - start
+                mark("model", elapsed * 1000)
+                self.record(name, elapsed, False, is_throttled(e))
+                error = e
+                continue
+
+            elapsed = time.monotonic() - start
+            mark("model", elapsed * 1000)
+            self.record(name, elapsed, True)
+            with self._lock:
+                counts = self.chosen.setdefault(request_class, {})
+                counts[name] = counts.get(name, 0) + 1
+            return response, name
+
+        raise error or AllModelsFailed(request_class)
+
+    async def stream_async(self, request_class: str, call):
+        """
+        call(model_name) يعيد async iterator لأجزاء النص.
+        التحويل لنموذج آخر ممكن فقط قبل وصول أول جزء؛ يعيد (model_name, chunks).
+        """
+        error = None
+        for name in self.candidates(request_class):
+            start = time.monotonic()
+            chunks = call(name)
+            try:
+                first = await chunks.__anext__()
+            except StopAsyncIteration:
+                first = None
+            except Exception as e:
+                elapsed = time.monotonic() - start
+                mark("model", elapsed * 1000)
+                self.record(name, elapsed, False, is_throttled(e))
+                error = e
+                continue
+
+            with self._lock:
+                counts = self.chosen.setdefault(request_class, {})
+                counts[name] = counts.get(name, 0) + 1
+            return name, self._rest(name, start, first, chunks)
+
+        raise error or AllModelsFailed(request_class)
+
+    async def _rest(self, name, start, first, chunks):
+        # انقطاع العميل (GeneratorExit / CancelledError) لا يُحسب فشلاً للنموذج
+        try:
+            if first is not None:
+                yield first
+                async for chunk in chunks:
+                    yield chunk
+        except Exception as e:
+            elapsed = time.monotonic() - start
+            mark("model", elapsed * 1000)
+            self.record(name, elapsed, False, is_throttled(e))
+            raise
+        finally:
+            aclose = getattr(chunks, "aclose", None)
+            if aclose:
+                await aclose()
+
+        elapsed = time.monotonic() - start
+        mark("model", elapsed * 1000)
+        self.record(name, elapsed, True)
+
+    def stats(self):
+        now = time.monotonic()
+        return {
+            "routes": self.routes,
+            "chosen": self.chosen,
+            "models": {
+                name: {
+                    "calls": h.calls,
+                    "avg_latency": round(h.latency(), 3),
+                    "error_rate": round(h.error_rate(now), 3),
+                    "throttled": h.throttled_until > now,
+                }
+                for name, h in self.health.items()
+            },
+        }
@@ -0,0 +1,258 @@
+"""
+تحويل التقارير إلى PDF في عمليات منفصلة.
+
+يحتاج خطاً عربياً TTF غير مرفق مع المشروع (مثل Amiri-Regular.ttf من
+https://github.com/aliftype/amiri/releases) في PDF_FONT_PATH، إضافة إلى
+reportlab و arabic-reshaper و python-bidi. يُفحص ذلك عند التشغيل عبر check()،
+وإن لم يتوفر تعيد نقطة PDF خطأ 503 بدل أن تفشل كل مرة داخل الـ worker.
+"""
+import asyncio
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+# ---------- Settings ----------
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", "2"))
+PDF_TIMEOUT = float(os.getenv("PDF_TIMEOUT", "20"))
+PDF_MAX_QUEUE = int(os.getenv("PDF_MAX_QUEUE", "32"))
+PDF_FONT_PATH = os.getenv("PDF_FONT_PATH", "fonts/Amiri-Regular.ttf")
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+# عناوين الأقسام بالترتيب
+SECTIONS = [
+    ("goal", "الهدف التربوي"),
+    ("summary", "نبذة مختصرة"),
+    ("steps", "إجراءات التنفيذ"),
+    ("strategies", "الاستراتيجيات"),
+    ("strengths", "نقاط القوة"),
+    ("improve", "نقاط التحسين"),
+    ("recomm", "التوصيات"),
+]
+
+INFO_FIELDS = [
+    ("education", "إدارة التعليم"),
+    ("school", "المدرسة"),
+    ("teacher", "المعلم"),
+    ("grade", "الصف"),
+    ("subject", "المادة"),
+    ("lesson", "الدرس"),
+    ("hijri_date", "التاريخ الهجري"),
+    ("gregorian_date", "التاريخ الميلادي"),
+]
+
+class PdfUnavailable(Exception):
+    pass
+
+class QueueFull(Exception):
+    pass
+
+# =====================================================
+# داخل عملية الـ worker
+# =====================================================
+_worker = {}
+
+def _init_worker(font_path: str):
+    # تُحمّل المكتبات والخط مرة واحدة لكل عملية
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.pdfgen import canvas
+    import arabic_reshaper
+    from bidi.algorithm import get_display
+
+    pdfmetrics.registerFont(TTFont("Arabic", font_path))
+
+    _worker.update(
+        canvas=canvas,
+        page_size=A4,
+        string_width=pdfmetrics.stringWidth,
+        shape=lambda text: get_display(arabic_reshaper.reshape(text)),
+    )
+
+def _wrap(text: str, width: float, size: int):
+    string_width = _worker["string_width"]
+    lines, line = [], ""
+    for word in text.split():
+        candidate = f"{line} {word}".strip()
+        if line and string_width(_worker["shape"](candidate), "Arabic", size) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    if line:
+        lines.append(line)
+    return lines
+
+def _render(report: dict) -> bytes:
+    shape = _worker["shape"]
+    page_width, page_height = _worker["page_size"]
+    margin = 50
+    right = page_width - margin
+    text_width = page_width - 2 * margin
+
+    buffer = io.BytesIO()
+    pdf = _worker["canvas"].Canvas(buffer, pagesize=_worker["page_size"])
+    y = page_height - margin
+
+    def line(text, size=12, gap=6):
+        nonlocal y
+        if y < margin + size:
+            pdf.showPage()
+            y = page_height - margin
+        pdf.setFont("Arabic", size)
+        pdf.drawRightString(right, y, shape(text))
+        y -= size + gap
+
+    line(report.get("report_type") or "تقرير", size=18, gap=14)
+
+    for key, title in INFO_FIELDS:
+        if report.get(key):
+            line(f"{title}: {report[key]}", size=11, gap=4)
+    y -= 10
+
+    for key, title in SECTIONS:
+        if not report.get(key):
+            continue
+        line(title, size=14, gap=6)
+        for text in _wrap(report[key], text_width, 12):
+            line(text, size=12, gap=4)
+        y -= 8
+
+    tools = report.get("tools") or []
+    if tools:
+        line("الأدوات التعليمية", size=14, gap=6)
+        for text in _wrap("، ".join(tools), text_width, 12):
+            line(text, size=12, gap=4)
+
+    pdf.save()
+    return buffer.getvalue()
+
+# =====================================================
+# داخل عملية الخادم
+# =====================================================
+class PdfRenderer:
+    """
+    تحويل التقارير إلى PDF في ProcessPool (خارج event loop).
+    النتائج تُخزن مؤقتاً بحسب hash المحتوى، ولكل مهمة مهلة.
+    """
+
+    def __init__(self, workers=PDF_WORKERS, timeout=PDF_TIMEOUT, max_queue=PDF_MAX_QUEUE,
+                 font_path=PDF_FONT_PATH):
+        self.workers = workers
+        self.timeout = timeout
+        self.max_queue = max_queue
+        self.font_path = font_path
+        self._pool = None
+        self._cache = OrderedDict()
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+        self.stats_counters = {
+            "in_flight": 0,
+            "completed": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "rejected": 0,
+            "cache_hits": 0,
+        }
+
+    def check(self):
+        """سبب عدم توفر الخدمة (نص) أو None؛ يُستدعى عند تشغيل الخادم"""
+        try:
+            import reportlab, arabic_reshaper, bidi  # noqa: F401
+        except ImportError as e:
+            return str(e)
+        if not os.path.isfile(self.font_path):
+            return f"Font not found: {os.path.abspath(self.font_path)} (set PDF_FONT_PATH)"
+        return None
+
+    def _get_pool(self):
+        if self._pool is None:
+            problem = self.check()
+            if problem:
+                raise PdfUnavailable(problem)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.font_path,),
+            )
+        return self._pool
+
+    @staticmethod
+    def content_hash(report: dict) -> str:
+        payload = json.dumps(report, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def _cache_get(self, key):
+        with self._lock:
+            pdf = self._cache.get(key)
+            if pdf is not None:
+                self._cache.move_to_end(key)
+            return pdf
+
+    def _cache_put(self, key, pdf: bytes):
+        with self._lock:
+            if key in self._cache:
+                return
+            self._cache[key] = pdf
+            self._cache_bytes += len(pdf)
+            while self._cache_bytes > CACHE_MAX_BYTES and self._cache:
+                _, old = self._cache.popitem(last=False)
+                self._cache_bytes -= len(old)
+
+    async def render(self, report: dict) -> bytes:
+        key = self.content_hash(report)
+        cached = self._cache_get(key)
+        if cached is not None:
+            self.stats_counters["cache_hits"] += 1
+            return cached
+
+        counters = self.stats_counters
+        pool = self._get_pool()
+        with self._lock:
+            if counters["in_flight"] >= self.max_queue:
+                counters["rejected"] += 1
+                raise QueueFull()
+            counters["in_flight"] += 1
+
+        future = pool.submit(_render, report)
+        # الرسم الجاري لا يمكن إيقافه بعد انتهاء المهلة ويبقى يشغل worker،
+        # فيُحسب ضمن in_flight حتى ينتهي فعلاً (أو يُلغى قبل أن يبدأ)
+        future.add_done_callback(self._release)
+        try:
+            pdf = await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            # إن لم تبدأ المهمة بعد تُلغى من الطابور
+            future.cancel()
+            counters["timeouts"] += 1
+            raise
+        except Exception:
+            counters["failed"] += 1
+            raise
+
+        counters["completed"] += 1
+        self._cache_put(key, pdf)
+        return pdf
+
+    def _release(self, _future):
+        with self._lock:
+            self.stats_counters["in_flight"] -= 1
+
+    def stats(self):
+        return {
+            **self.stats_counters,
+            "available": self.check() is None,
+            "queue_depth": max(self.stats_counters["in_flight"] - self.workers, 0),
+            "max_queue": self.max_queue,
+            "workers": self.workers,
+            "cache_entries": len(self._cache),
+            "cache_bytes": self._cache_bytes,
+        }
+
+def iter_chunks(data: bytes, size: int = CHUNK_SIZE):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+
+# ---------- Settings ----------
+DB_FILE = os.getenv("QUESTION_BANK_PATH", "question_bank.db")
+
+# توحيد الحروف العربية وإزالة التشكيل لمطابقة صيغ الموضوع المختلفة
+_ARABIC_MAP = str.maketrans({
+    "أ": "ا", "إ": "ا", "آ": "ا", "ٱ": "ا",
+    "ى": "ي", "ة": "ه", "ـ": None,
+    **{chr(c): None for c in range(0x064B, 0x0653)},   # الحركات والتنوين والشدة والسكون
+})
+_SPACES = re.compile(r"\s+")
+_PUNCT = re.compile(r"[^\w\s]")
+
+def normalize_topic(topic: str) -> str:
+    topic = topic.translate(_ARABIC_MAP).lower()
+    topic = _PUNCT.sub(" ", topic)
+    return _SPACES.sub(" ", topic).strip()
+
+def _q_hash(question: dict) -> str:
+    return hashlib.sha256(normalize_topic(question["q"]).encode("utf-8")).hexdigest()
+
+class QuestionBank:
+    """
+    بنك أسئلة محلي مفهرس بـ (الموضوع بعد التوحيد، اللغة).
+    يتتبع الأسئلة التي رآها كل جهاز حتى لا تتكرر عليه.
+    """
+
+    def __init__(self, path=DB_FILE):
+        self.path = path
+        self._local = threading.local()
+
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS questions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                topic_key TEXT NOT NULL,
+                lang TEXT NOT NULL,
+                q_hash TEXT NOT NULL,
+                data BLOB NOT NULL,
+                created_at TEXT NOT NULL,
+                UNIQUE (topic_key, lang, q_hash)
+            );
+            CREATE TABLE IF NOT EXISTS seen (
+                device_id TEXT NOT NULL,
+                question_id INTEGER NOT NULL,
+                PRIMARY KEY (device_id, question_id)
+            ) WITHOUT ROWID;
+        """)
+        conn.commit()
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout=10000")
+            self._local.conn = conn
+        return conn
+
+    def depth(self, topic: str, lang: str) -> int:
+        return self._conn().execute(
+            "SELECT COUNT(*) FROM questions WHERE topic_key = ? AND lang = ?",
+            (normalize_topic(topic), lang)
+        ).fetchone()[0]
+
+    def sample(self, topic: str, lang: str, device_id: str, count: int):
+        """
+        حتى count سؤال لم يرها الجهاز (بترتيب عشوائي).
+        لا تُسجل كمرئية هنا: تُمرر إلى add(..., delivered=...) بعد نجاح الطلب فقط.
+        """
+        conn = self._conn()
+        rows = conn.execute("""
+            SELECT id, data FROM questions
+            WHERE topic_key = ? AND lang = ?
+              AND NOT EXISTS (
+                  SELECT 1 FROM seen WHERE seen.device_id = ? AND seen.question_id = questions.id
+              )
+            ORDER BY random()
+            LIMIT ?
+        """, (normalize_topic(topic), lang, device_id, count)).fetchall()
+
+        return [json.loads(zlib.decompress(r[1]).decode("utf-8")) for r in rows]
+
+    def add(self, topic: str, lang: str, questions, device_id: str = None, delivered=()):
+        """
+        إضافة أسئلة مولّدة للبنك (المكرر يُتجاهل)، وتسجيلها كمرئية للجهاز الذي طلبها.
+        delivered: أسئلة من sample وصلت للجهاز (تُسجل كمرئية فقط، دون إضافة).
+        """
+        if not questions and not delivered:
+            return
+        topic_key = normalize_topic(topic)
+        now = datetime.utcnow().isoformat()
+        hashes = [_q_hash(q) for q in questions]
+
+        conn = self._conn()
+        if questions:
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO questions (topic_key, lang, q_hash, data, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (topic_key, lang, h, zlib.compress(json.dumps(q, ensure_ascii=False).encode("utf-8")), now)
+                        for h, q in zip(hashes, questions)
+                    ]
+                )
+
+        if device_id:
+            hashes += [_q_hash(q) for q in delivered]
+            placeholders = ",".join("?" * len(hashes))
+            ids = conn.execute(
+                f"SELECT id FROM questions WHERE topic_key = ? AND lang = ? AND q_hash IN ({placeholders})",
+                (topic_key, lang, *hashes)
+            ).fetchall()
+            self._mark_seen(device_id, [r[0] for r in ids])
+
+    def _mark_seen(self, device_id: str, question_ids):
+        if not question_ids:
+            return
+        conn = self._conn()
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO seen (device_id, question_id) VALUES (?, ?)",
+                [(device_id, qid) for qid in question_ids]
+            )
+
+    def stats(self):
+        conn = self._conn()
+        return {
+            "questions": conn.execute("SELECT COUNT(*) FROM questions").fetchone()[0],
+            "topics": conn.execute("SELECT COUNT(DISTINCT topic_key || '|' || lang) FROM questions").fetchone()[0],
+            "devices": conn.execute("SELECT COUNT(DISTINCT device_id) FROM seen").fetchone()[0],
+        }
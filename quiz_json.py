@@ -0,0 +1,121 @@
+import json
+import re
+
+import fastjsonschema
+
+# ---------- Schema ----------
+QUESTION_SCHEMA = {
+    "type": "object",
+    "required": ["q", "options", "answer", "explanations"],
+    "properties": {
+        "q": {"type": "string", "minLength": 1},
+        "options": {
+            "type": "array", "minItems": 4, "maxItems": 4,
+            "items": {"type": "string", "minLength": 1},
+        },
+        "answer": {"type": "integer", "minimum": 0, "maximum": 3},
+        "explanations": {
+            "type": "array", "minItems": 4, "maxItems": 4,
+            "items": {"type": "string"},
+        },
+    },
+}
+
+# يُحوّل إلى دالة Python مرة واحدة عند الاستيراد
+_validate = fastjsonschema.compile(QUESTION_SCHEMA)
+
+_FENCE = re.compile(r"```(?:json)?", re.IGNORECASE)
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+def _loads(text: str):
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    try:
+        return json.loads(_TRAILING_COMMA.sub(r"\1", text))
+    except ValueError:
+        return None
+
+def _objects(text: str, start: int):
+    """
+    استخراج كائنات {...} المكتملة من مصفوفة تبدأ عند start (مع تجاهل الأقواس داخل النصوص).
+    الكائن الأخير المقطوع (رد ناقص) يُتجاهل.
+    """
+    depth = 0
+    begin = None
+    in_string = False
+    escape = False
+
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch == "{":
+            if depth == 0:
+                begin = i
+            depth += 1
+        elif ch == "}" and depth:
+            depth -= 1
+            if depth == 0:
+                yield text[begin:i + 1]
+        elif ch == "]" and depth == 0:
+            return
+
+def extract_questions(text: str):
+    """كل عناصر الأسئلة التي يمكن استرجاعها من رد النموذج، حتى لو كان JSON مكسوراً"""
+    if not text:
+        return []
+    text = _FENCE.sub("", text)
+
+    s = text.find("{")
+    e = text.rfind("}") + 1
+    data = _loads(text[s:e]) if s != -1 and e > s else None
+    if isinstance(data, dict) and isinstance(data.get("questions"), list):
+        return data["questions"]
+
+    # إصلاح تدريجي: كل سؤال يُحلل وحده
+    key = text.find('"questions"')
+    start = text.find("[", key if key != -1 else 0)
+    if start == -1:
+        return []
+
+    items = []
+    for chunk in _objects(text, start + 1):
+        item = _loads(chunk)
+        if item is not None:
+            items.append(item)
+    return items
+
+def is_valid(question) -> bool:
+    try:
+        _validate(question)
+        return True
+    except fastjsonschema.JsonSchemaException:
+        return False
+
+def _normalize(question):
+    # "answer": "2" شائع في ردود النموذج
+    if isinstance(question, dict) and isinstance(question.get("answer"), str) and question["answer"].strip().isdigit():
+        question = {**question, "answer": int(question["answer"])}
+    return question
+
+def parse_questions(text: str):
+    """الأسئلة الصالحة فقط (بدون تكرار) من رد النموذج"""
+    valid = []
+    seen = set()
+    for question in extract_questions(text):
+        question = _normalize(question)
+        if is_valid(question) and question["q"] not in seen:
+            seen.add(question["q"])
+            valid.append(question)
+    return valid
@@ -0,0 +1,65 @@
+"""
+تجميع عدة تقارير في برومت واحد (ملف الأداء الوظيفي) ثم فصل الرد لكل تقرير.
+كل تقرير في الرد يبدأ بسطر رمزه (### [R1]) ثم حقوله السبعة المرقمة كالمعتاد.
+"""
+import os
+import re
+from typing import Dict, List
+
+# ---------- Settings ----------
+# عدد التقارير في البرومت الواحد (أكبر = طلبات أقل، ورد أطول)
+PACK_SIZE = int(os.getenv("PORTFOLIO_PACK_SIZE", "5"))
+MAX_REPORTS = int(os.getenv("PORTFOLIO_MAX_REPORTS", "40"))
+
+FIELD_COUNT = 7
+
+OUTPUT_FORMAT = """
+
+**صيغة الإخراج لعدة تقارير (إلزامية):**
+اكتب كل تقرير من التقارير المطلوبة أعلاه مستقلاً، بنفس الضوابط والحقول السبعة.
+ابدأ كل تقرير بسطر مستقل يحتوي رمزه فقط بالشكل: ### [R1]
+ثم الحقول السبعة لهذا التقرير، كل حقل في سطر منفصل يبدأ برقمه فقط دون ذكر العنوان.
+لا تكتب أي نص خارج هذه الكتل."""
+
+_MARKER = re.compile(r"^[ \t]*#{1,6}[ \t]*\[?R(\d+)\]?[ \t]*$", re.MULTILINE)
+_FIELD_LINE = re.compile(r"^[ \t]*([1-7١-٧])\.", re.MULTILINE)
+_ARABIC_DIGITS = str.maketrans("١٢٣٤٥٦٧", "1234567")
+
+def chunks(items: List, size: int = PACK_SIZE):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+def report_list(reports: List[dict]) -> str:
+    """قائمة التقارير بدل سطور "التقرير المطلوب" في قالب الدور"""
+    lines = ["التقارير المطلوبة:"]
+    for i, r in enumerate(reports, 1):
+        lines.append(
+            f'[R{i}] التقرير: "{r["report_name"]}" - التصنيف الفرعي: "{r["subcategory_name"]}"'
+            f' - المعيار التربوي: "{r["criterion_name"]}"'
+        )
+    return "\n".join(lines)
+
+def _complete(body: str) -> bool:
+    found = {m.group(1).translate(_ARABIC_DIGITS) for m in _FIELD_LINE.finditer(body)}
+    return len(found) == FIELD_COUNT
+
+def split_packed(text: str, count: int) -> Dict[int, str]:
+    """
+    {رقم التقرير (من 1): نصه} للتقارير المكتملة فقط (الحقول السبعة موجودة).
+    الناقص أو المكرر أو خارج النطاق يُترك ليُولد منفرداً.
+    """
+    if not text:
+        return {}
+    parts = _MARKER.split(text)
+    result = {}
+    seen = set()
+    for i in range(1, len(parts) - 1, 2):
+        n = int(parts[i])
+        body = parts[i + 1].strip()
+        if n in seen:
+            result.pop(n, None)
+            continue
+        seen.add(n)
+        if 1 <= n <= count and _complete(body):
+            result[n] = body
+    return result
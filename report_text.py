@@ -0,0 +1,234 @@
+import random
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+# =====================================================
+# عبارات الإثراء
+# =====================================================
+LINGUISTIC_ENRICHMENT = [
+    "بما يعزز من فاعلية العملية التعليمية ويرتقي بمستوى الممارسات الصفية",
+    "بما ينسجم مع توجهات التعليم الحديثة ونواتج التعلم المستهدفة",
+    "بأسلوب مهني يعكس التخطيط الجيد والتنفيذ التربوي الفعال",
+    "وفق معايير تربوية تسهم في تحسين جودة التعليم داخل الصف",
+    "وبما يدعم بناء بيئة تعلم محفزة ومشجعة على المشاركة",
+]
+
+# عبارات تُضاف أولاً للنصوص القصيرة جداً (أقل من 15 كلمة)
+ENHANCEMENTS = [
+    "بما يعزز من جودة الممارسة التعليمية وينسجم مع أهداف المنهج",
+    "وذلك لتحقيق نواتج التعلم المستهدفة ورفع مستوى التحصيل الدراسي",
+    "بما يدعم التطوير المهني المستدام ويعزز فاعلية العملية التعليمية",
+    "ويسهم في بناء بيئة تعلمية محفزة تدعم الإبداع والتميز",
+    "وذلك تماشياً مع رؤية التعليم الحديثة واستراتيجياته التطويرية",
+    "بما يرتقي بالممارسات الصفية ويعزز الشراكة المجتمعية الفاعلة",
+]
+
+# تحليل السياق من نوع التقرير
+CONTEXT_KEYWORDS = {
+    "تقرير علاجي": ["العلاج", "الدعم", "تحسين", "تقدم"],
+    "تقرير سلوكي": ["السلوك", "تحفيز", "تعزيز", "مكافأة"],
+    "تقرير تقييمي": ["تقييم", "قياس", "نتائج", "مؤشرات"],
+    "تقرير نشاط": ["نشاط", "مشاركة", "تفاعل", "تطبيق"],
+}
+
+CLOSING_PHRASE = "مما يسهم في تحقيق الأهداف التربوية المنشودة."
+SENTENCE_SEPARATOR = "،"
+FINAL_MARKS = (".", "!", "؟")
+
+# كل عبارة مقطّعة مسبقاً: (tokens, أول 3 كلمات)
+def _tokenize_phrases(phrases):
+    return [(p.split(), frozenset(p.split()[:3])) for p in phrases]
+
+_ENHANCEMENT_TOKENS = _tokenize_phrases(ENHANCEMENTS)
+_CLOSING_TOKENS = CLOSING_PHRASE.split()
+_PHRASE_CACHE = {}
+
+def _phrases_for(report_type: str):
+    if report_type not in _PHRASE_CACHE:
+        phrases = []
+        for keyword, words in CONTEXT_KEYWORDS.items():
+            if keyword in report_type:
+                phrases.extend(words)
+        _PHRASE_CACHE[report_type] = _tokenize_phrases(phrases or LINGUISTIC_ENRICHMENT)
+    return _PHRASE_CACHE[report_type]
+
+def _seed(text: str, report_type: str) -> int:
+    return zlib.crc32(f"{report_type}\x00{text}".encode("utf-8"))
+
+def _fill(tokens, min_words, phrases, seed):
+    """
+    إكمال النص حتى min_words. ينتهي دائماً:
+    كل عبارة غير متداخلة تُجرّب مرة واحدة (بدءاً من موضع تحدده البذرة)،
+    ثم تُكرر العبارات بالترتيب (كل إضافة تزيد كلمة على الأقل).
+    """
+    present = set(tokens)
+
+    if len(tokens) < 15:
+        for phrase, head in _ENHANCEMENT_TOKENS[:min(2, (min_words - len(tokens)) // 10)]:
+            if len(tokens) >= min_words:
+                break
+            tokens.extend(phrase)
+            present.update(phrase)
+
+    if len(tokens) >= min_words or not phrases:
+        return tokens
+
+    start = seed % len(phrases)
+    order = list(range(start, len(phrases))) + list(range(start))
+
+    for i in order:
+        if len(tokens) >= min_words:
+            return tokens
+        phrase, head = phrases[i]
+        if present.isdisjoint(head):
+            tokens.extend(phrase)
+            present.update(phrase)
+
+    i = 0
+    while len(tokens) < min_words:
+        tokens.extend(phrases[order[i % len(order)]][0])
+        i += 1
+    return tokens
+
+def _trim(text, tokens, min_words, max_words):
+    """تقليم على حدود الجمل (،) ثم قص الكلمات الزائدة"""
+    sentences = text.split(SENTENCE_SEPARATOR)
+    if len(sentences) > 1:
+        kept = []
+        count = 0
+        for sentence in sentences:
+            sentence_tokens = sentence.split()
+            if count + len(sentence_tokens) > max_words - 5:  # ترك مساحة للختام
+                break
+            kept.append(sentence_tokens)
+            count += len(sentence_tokens)
+
+        if count >= min_words:
+            tokens = []
+            for sentence_tokens in kept:
+                if tokens and sentence_tokens:
+                    # الفاصلة تُلصق بآخر كلمة وليست كلمة مستقلة
+                    tokens[-1] += SENTENCE_SEPARATOR
+                tokens.extend(sentence_tokens)
+            tokens[-1] += SENTENCE_SEPARATOR
+            tokens.extend(_CLOSING_TOKENS)
+
+    return tokens[:max_words]
+
+def _enforce(text, min_words, max_words, phrases, seed):
+    tokens = text.split()
+    if not tokens:
+        return text
+
+    if len(tokens) < min_words:
+        tokens = _fill(tokens, min_words, phrases, seed)
+        text = " ".join(tokens)
+
+    if len(tokens) > max_words:
+        tokens = _trim(text, tokens, min_words, max_words)
+
+    text = " ".join(tokens)
+
+    # إضافة نقطة نهائية إذا لم تكن موجودة
+    if not text.endswith(FINAL_MARKS):
+        text += "."
+
+    return text
+
+def enrich_and_enforce(text: str, min_words=25, max_words=35, report_type: str = "",
+                       seed: Optional[int] = None) -> str:
+    """
+    إثراء النص وتطبيق الحد الأدنى والأقصى للكلمات (زمن خطي في طول النص).
+    ترتيب عبارات الإثراء محدد بالبذرة (افتراضياً مشتقة من النص ونوع التقرير).
+    """
+    if seed is None:
+        seed = _seed(text, report_type)
+    return _enforce(text, min_words, max_words, _phrases_for(report_type), seed)
+
+def enrich_fields(fields: Dict[str, str], min_words=25, max_words=35, report_type: str = "",
+                  seed: Optional[int] = None) -> Dict[str, str]:
+    """تطبيق enrich_and_enforce على كل حقول التقرير في تمريرة واحدة (الحقول الفارغة تبقى كما هي)"""
+    phrases = _phrases_for(report_type)
+    result = {}
+    for i, (key, value) in enumerate(fields.items()):
+        if not value:
+            result[key] = value
+            continue
+        field_seed = _seed(value, report_type) if seed is None else seed + i
+        result[key] = _enforce(value, min_words, max_words, phrases, field_seed)
+    return result
+
+# =====================================================
+# تحليل حقول التقرير من رد النموذج
+# =====================================================
+FIELD_ORDER = ("goal", "summary", "steps", "strategies", "strengths", "improve", "recomm")
+
+# (رقم لاتيني، رقم عربي، الحقل) لكل سطر يبدأ حقلاً جديداً
+_FIELD_MARKERS = tuple(
+    (f"{latin}.", f"{arabic}.", name)
+    for latin, arabic, name in zip("1234567", "١٢٣٤٥٦٧", FIELD_ORDER)
+)
+_FIELD_DIGITS = tuple("1234567١٢٣٤٥٦٧")
+
+class ReportFieldParser:
+    """
+    تحليل الرد المرقم (1. ... 7.) تدريجياً أثناء وصوله من النموذج.
+    feed يعيد الحقول التي اكتملت (بدأ الحقل التالي) بعد الإثراء وتطبيق حدود الكلمات،
+    و finish يعيد الحقل الأخير، أو النصوص الافتراضية إذا لم يُستخرج أي حقل.
+    """
+
+    def __init__(self, report_type: str = "", min_words=25, max_words=30,
+                 defaults: Optional[Dict[str, List[str]]] = None, default_max_words=35):
+        self.report_type = report_type
+        self.min_words = min_words
+        self.max_words = max_words
+        self.defaults = defaults or {}
+        self.default_max_words = default_max_words
+        self.fields = dict.fromkeys(FIELD_ORDER, "")
+        self._buffer = ""
+        self._current = None
+        self._content = []
+
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split("\n")
+        completed = []
+        for line in lines:
+            self._line(line, completed)
+        return completed
+
+    def finish(self) -> List[Tuple[str, str]]:
+        completed = []
+        self._line(self._buffer, completed)
+        self._buffer = ""
+        self._close(completed)
+
+        if not any(self.fields.values()):
+            for key in self.fields:
+                if key in self.defaults:
+                    self.fields[key] = random.choice(self.defaults[key])
+            self.fields = enrich_fields(self.fields, self.min_words, self.default_max_words, self.report_type)
+            completed = [(key, value) for key, value in self.fields.items() if value]
+        return completed
+
+    def _line(self, line: str, completed):
+        line = line.strip()
+        for latin, arabic, name in _FIELD_MARKERS:
+            if line.startswith(latin) or line.startswith(arabic):
+                self._close(completed)
+                self._current = name
+                self._content = [line[2:].strip()]
+                return
+        if self._current and line and not line.startswith(_FIELD_DIGITS):
+            self._content.append(line)
+
+    def _close(self, completed):
+        if not (self._current and self._content):
+            return
+        text = " ".join(self._content).strip()
+        if text:
+            text = enrich_and_enforce(text, self.min_words, self.max_words, self.report_type)
+            completed.append((self._current, text))
+        self.fields[self._current] = text
+        self._current = None
+        self._content = []
@@ -0,0 +1,126 @@
+"""
+قياس مراحل الطلب وإرسالها في ترويسة Server-Timing وسطر log واحد (JSON) لكل طلب.
+
+داخل المعالج (أو dependency أو دالة مساعدة):
+    with phase("model"):
+        response = ...
+
+المرحلة خارج طلب مُعاين (أو داخل مهمة خلفية) لا تكلف شيئاً تقريباً.
+"""
+import contextvars
+import json
+import logging
+import os
+import random
+import time
+from contextlib import contextmanager
+
+# ---------- Settings ----------
+# نسبة الطلبات التي تُقاس (0..1) حتى يبقى مفعلاً في الإنتاج
+SAMPLE_RATE = float(os.getenv("SERVER_TIMING_SAMPLE", "1.0"))
+# إرسال الترويسة للعميل (يمكن تعطيلها مع إبقاء سطر الـ log)
+EXPOSE_HEADER = os.getenv("SERVER_TIMING_HEADER", "1") != "0"
+# مستوى سطر الـ log (WARNING يوقفه مع إبقاء الترويسة)
+LOG_LEVEL = os.getenv("SERVER_TIMING_LOG_LEVEL", "INFO").upper()
+
+# handler خاص: uvicorn لا يضبط الـ root logger، فبدونه تُسقط سطور INFO
+logger = logging.getLogger("server_timing")
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.propagate = False
+logger.setLevel(LOG_LEVEL)
+
+class Timings:
+    __slots__ = ("phases",)
+
+    def __init__(self):
+        self.phases = {}    # name -> [total_ms, count]
+
+    def add(self, name: str, ms: float):
+        entry = self.phases.get(name)
+        if entry is None:
+            self.phases[name] = [ms, 1]
+        else:
+            entry[0] += ms
+            entry[1] += 1
+
+    def header(self, total_ms: float) -> str:
+        parts = [f"{name};dur={ms:.1f}" for name, (ms, _) in self.phases.items()]
+        parts.append(f"total;dur={total_ms:.1f}")
+        return ", ".join(parts)
+
+# كائن قابل للتعديل: الـ threadpool ينسخ السياق، فالتعديل يظهر للـ middleware
+_current = contextvars.ContextVar("server_timing", default=None)
+
+def current():
+    return _current.get()
+
+@contextmanager
+def phase(name: str):
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, (time.perf_counter() - start) * 1000)
+
+def mark(name: str, ms: float):
+    """تسجيل مدة مقاسة مسبقاً"""
+    timings = _current.get()
+    if timings is not None:
+        timings.add(name, ms)
+
+class ServerTimingMiddleware:
+    """ASGI middleware خفيف (دون BaseHTTPMiddleware حتى لا يُنسخ جسم الاستجابة)"""
+
+    def __init__(self, app, sample_rate: float = SAMPLE_RATE, expose_header: bool = EXPOSE_HEADER):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.expose_header = expose_header
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or random.random() >= self.sample_rate:
+            await self.app(scope, receive, send)
+            return
+
+        timings = Timings()
+        token = _current.set(timings)
+        start = time.perf_counter()
+        state = {"status": 0, "ttfb": 0.0}
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                elapsed = (time.perf_counter() - start) * 1000
+                state["status"] = message["status"]
+                state["ttfb"] = elapsed
+                if self.expose_header:
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"server-timing", timings.header(elapsed).encode("latin-1"))
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            if logger.isEnabledFor(logging.INFO):
+                self._log(scope, state, start, timings)
+
+    @staticmethod
+    def _log(scope, state, start, timings):
+        logger.info(json.dumps({
+            "method": scope.get("method"),
+            "path": scope.get("path"),
+            "status": state["status"],
+            "ttfb_ms": round(state["ttfb"], 1),
+            "total_ms": round((time.perf_counter() - start) * 1000, 1),
+            "phases": {
+                name: {"ms": round(ms, 1), "count": count}
+                for name, (ms, count) in timings.phases.items()
+            },
+        }, ensure_ascii=False))
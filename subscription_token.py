@@ -0,0 +1,103 @@
+"""
+توكن اشتراك موقع (HMAC-SHA256) قصير العمر يحمل: رقم الكود، صلاحيته، والاستخدام.
+يُصدر مع كل تحقق كامل من كود التفعيل ويُعاد إصداره بعد كل تغيّر في الاستخدام،
+فتتحقق منه مسارات القراءة فقط (/subscription/status, /health) دون أي قراءة من القاعدة.
+
+الصيغة: base64url(JSON) "." base64url(HMAC)
+"""
+import base64
+import contextvars
+import hashlib
+import hmac
+import json
+import os
+import time
+from datetime import datetime
+
+# ---------- Settings ----------
+# يجب أن يكون ثابتاً ومشتركاً بين الـ workers، وإلا لا يُقبل التوكن إلا من الـ worker الذي أصدره
+SECRET = os.getenv("SUBSCRIPTION_TOKEN_SECRET")
+if not SECRET:
+    raise RuntimeError("SUBSCRIPTION_TOKEN_SECRET not set")
+SECRET = SECRET.encode("utf-8")
+TOKEN_TTL = int(os.getenv("SUBSCRIPTION_TOKEN_TTL", "120"))
+
+HEADER = "X-Subscription-Token"
+
+# أعمدة الاشتراك المنسوخة إلى التوكن (ما يوجد منها في الصف)
+CLAIM_FIELDS = ("started_at", "expires_at", "duration_minutes", "duration_days",
+                "usage_limit", "usage_count")
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+def _unb64(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+def _sign(body: str) -> str:
+    return _b64(hmac.new(SECRET, body.encode("ascii"), hashlib.sha256).digest())
+
+def issue(row: dict):
+    """(token, claims) من صف activation_codes؛ لا يتجاوز عمره انتهاء الاشتراك نفسه"""
+    now = int(time.time())
+    exp = now + TOKEN_TTL
+    if row.get("expires_at"):
+        expiry = datetime.fromisoformat(row["expires_at"])
+        exp = min(exp, int((expiry - datetime.utcnow()).total_seconds()) + now)
+
+    claims = {"cid": row["id"], "iat": now, "exp": exp}
+    claims.update({field: row[field] for field in CLAIM_FIELDS if field in row})
+
+    body = _b64(json.dumps(claims, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+    return f"{body}.{_sign(body)}", claims
+
+def verify(token: str):
+    """claims إن كان التوكن سليم التوقيع ولم ينتهِ، وإلا None"""
+    if not token or token.count(".") != 1:
+        return None
+    body, signature = token.split(".")
+    if not hmac.compare_digest(signature, _sign(body)):
+        return None
+    try:
+        claims = json.loads(_unb64(body))
+    except ValueError:
+        return None
+    if claims.get("exp", 0) <= time.time():
+        return None
+    return claims
+
+# ---------- إرفاق التوكن بالاستجابة ----------
+# كائن قابل للتعديل: الـ threadpool ينسخ السياق، فالتعديل يظهر للـ middleware
+_pending = contextvars.ContextVar("subscription_token", default=None)
+
+def attach(token: str):
+    """إرسال التوكن في ترويسة X-Subscription-Token للاستجابة الحالية"""
+    holder = _pending.get()
+    if holder is not None:
+        holder["token"] = token
+
+class SubscriptionTokenMiddleware:
+    """يضيف آخر توكن صدر أثناء الطلب إلى ترويسات الاستجابة (أياً كان نوعها)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        holder = {}
+        reset = _pending.set(holder)
+
+        async def send_with_token(message):
+            if message["type"] == "http.response.start" and holder.get("token"):
+                message["headers"] = list(message.get("headers", [])) + [
+                    (HEADER.lower().encode("latin-1"), holder["token"].encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_token)
+        finally:
+            _pending.reset(reset)
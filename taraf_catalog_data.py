@@ -0,0 +1,296 @@
+# كتالوجات أنواع التقارير والنصوص الافتراضية والقوائم الثابتة لنسخة taraf.
+# لا يستوردها التطبيق مباشرة: تُحوَّل إلى taraf_catalog.snap عبر
+#     python catalog_snapshot.py taraf_catalog_data.py taraf_catalog.snap
+# ويُعاد بناء اللقطة تلقائياً عند بدء التشغيل إذا تغيّر هذا الملف.
+
+
+# =====================================================
+# أنواع التقارير (تم نقلها من الفرونت إند)
+# =====================================================
+REPORTS_BY_CATEGORY = {
+    "التقارير التعليمية الصفية": [
+        "تقرير أنشطة صفية",
+        "تقرير توزيع وقت الحصة",
+        "تقرير درس تم تنفيذه",
+        "تقرير تعليم تعاوني بين الطلاب",
+        "تقرير المشاركات بين الطلاب",
+        "تقرير توزيع المنهج",
+        "تقرير الفصول المقلوبة",
+        "تقرير تنفيذ درس تطبيقي",
+        "تقرير تفعيل الفصول الافتراضية",
+        "تقرير التعليم المدمج",
+        "تقرير التعليم عن بعد",
+        "تقرير استخدام أنظمة إدارة التعلم",
+        "تقرير إدارة الوقت في الصف",
+        "تقرير تنظيم البيئة الصفية",
+        "تقرير إدارة الموارد التعليمية",
+        "تقرير إدارة السلوك الصفي",
+        "تقرير الأنشطة التفاعلية",
+        "تقرير العروض العملية",
+        "تقرير التعلم التعاوني",
+        "تقرير التعلم الذاتي الموجه",
+        "تقرير الألعاب التعليمية الرقمية",
+        "تقرير التعلم بالأقران",
+        "تقرير استراتيجيات التدريس المستخدمة",
+        "تقرير تنويع أساليب الشرح",
+        "تقرير مراعاة الفروق الفردية",
+        "تقرير تفعيل مهارات التفكير",
+        "تقرير دمج مهارات القرن الحادي والعشرين",
+        "تقرير توظيف الوسائل التعليمية",
+        "تقرير التهيئة الذهنية للدرس",
+        "تقرير ختام الدرس والتقويم الختامي",
+        "تقرير ربط الدرس بالحياة"
+    ],
+    "التقارير العلاجية والدعم الفردي": [
+        "تقرير خطة علاجية",
+        "تقرير سجل الخطط العلاجية",
+        "تقرير رعاية الطلاب المتأخرين دراسيًا",
+        "تقرير دراسة حالة",
+        "تقرير معرفة الميول والاتجاهات",
+        "تقرير التحليل الاحتياجات التدريبية",
+        "تقرير دعم الطلاب ذوي الإعاقة",
+        "تقرير خطة دعم فردية",
+        "تقرير متابعة التحسن الأكاديمي",
+        "تقرير تشخيص صعوبات التعلم",
+        "تقرير برامج التقوية",
+        "تقرير الإرشاد الأكاديمي الفردي",
+        "تقرير متابعة الخطط العلاجية",
+        "تقرير دعم الموهبة منخفضة التحصيل"
+    ],
+    "التقارير التحفيزية والسلوكية": [
+        "تقرير تحفيز الطلاب",
+        "تقرير تعزيز السلوك الإيجابي",
+        "تقرير نظام الحوافز والمكافآت",
+        "تقرير برنامج الدعم النفسي",
+        "تقرير تحسين نتائج العلوم في الاختبارات الوطنية (نافس)",
+        "تقرير تحسين نتائج الرياضيات في الاختبارات الوطنية (نافس)",
+        "تقرير تحسين نتائج اللغة العربية في الاختبارات الوطنية (نافس)",
+        "تقرير الانضباط المدرسي",
+        "تقرير معالجة السلوكيات السلبية",
+        "تقرير تعزيز الدافعية للتعلم",
+        "تقرير بناء الاتجاهات الإيجابية",
+        "تقرير متابعة السلوك الفردي",
+        "تقرير برامج تعديل السلوك",
+        "تقرير تعزيز القيم والاتجاهات"
+    ],
+    "تقارير الأنشطة غير الصفية": [
+        "تقرير نشاط إثرائي",
+        "تقرير رعاية الموهوبين",
+        "تقرير المبادرات والابتكار",
+        "تقرير تفعيل المنصات التعليمية",
+        "تقرير حصة النشاط",
+        "تقرير تفعيل حصص النشاط",
+        "تقرير تنفيذ إذاعة مدرسية",
+        "تقرير الزيارات الميدانية",
+        "تقرير مبادرة تطوعية",
+        "تقرير الاحتفال باليوم الوطني",
+        "تقرير المعلم الصغير",
+        "تقرير الأندية الطلابية",
+        "تقرير المسابقات التعليمية",
+        "تقرير الأنشطة الثقافية",
+        "تقرير الأنشطة العلمية",
+        "تقرير الأنشطة الرياضية",
+        "تقرير الأنشطة الفنية",
+        "تقرير المعارض المدرسية",
+        "تقرير الأيام العالمية",
+        "تقرير البرامج الموسمية"
+    ],
+    "تقارير التواصل مع أولياء الأمور والمجتمع": [
+        "تقرير التواصل مع ولي الأمر",
+        "تقرير إشعار ولي الأمر عن مستوى ابنه",
+        "تقرير سجل التواصل مع أولياء الأمور",
+        "تقرير حضور اجتماع أولياء الأمور",
+        "تقرير الشراكات المهنية",
+        "تقرير مجتمعات التعلم",
+        "تقرير المجتمعات المهنية",
+        "تقرير اللقاءات التربوية",
+        "تقرير المبادرات المجتمعية",
+        "تقرير التواصل الإلكتروني مع أولياء الأمور",
+        "تقرير الزيارات المنزلية",
+        "تقرير استطلاع رضا أولياء الأمور",
+        "تقرير التعاون مع الجهات الخارجية",
+        "تقرير العمل التطوعي المجتمعي"
+    ],
+    "التقارير التخطيطية والتنظيمية": [
+        "تقرير خطة أسبوعية",
+        "تقرير تفعيل الخطة الأسبوعية",
+        "تقرير تخطيط المشاريع التعليمية",
+        "تقرير تخطيط الرحلات التعليمية",
+        "تقرير إدارة الاجتماعات",
+        "تقرير المناوبة والفسحة",
+        "تقرير الإشراف اليومي",
+        "تقرير إدارة الأزمات",
+        "تقرير الخطة الفصلية",
+        "تقرير الخطة السنوية",
+        "تقرير تنظيم الجداول الدراسية",
+        "تقرير تنظيم المهام الإدارية",
+        "تقرير توزيع الأدوار",
+        "تقرير إدارة الوقت المدرسي",
+        "تقرير متابعة تنفيذ الخطط"
+    ],
+    "تقارير التقييم والمتابعة": [
+        "تقرير كشف المتابعة",
+        "تقرير تصنيف الطلاب",
+        "تقرير تنفيذ اختبار تحسن",
+        "تقرير سجل الدرجات الإلكتروني",
+        "تقرير تحليل النتائج",
+        "تقرير مقارنة السلاسل الزمنية",
+        "تقرير قياس الأثر التعليمي",
+        "تقرير مؤشرات الأداء التعليمي",
+        "تقرير تقييم المخرجات التعليمية",
+        "تقرير تقييم المشاريع الطلابية",
+        "تقرير تقييم الأداء العملي",
+        "تقرير تقييم المحافظ الإلكترونية",
+        "تقرير التقييم الإلكتروني",
+        "تقرير تحليل نتائج الاختبارات التشخيصية",
+        "تقرير تحليل الاختبارات التحصيلية",
+        "تقرير متابعة مستوى الإتقان",
+        "تقرير فجوات التعلم",
+        "تقرير تقدم الطلاب",
+        "تقرير تحليل بنود الاختبار",
+        "تقرير متابعة نواتج التعلم"
+    ],
+    "تقارير التدريب والتطوير المهني": [
+        "تقرير حضور دورات وورش تدريبية",
+        "تقرير الورش التدريبية التي قدمتها",
+        "تقرير التدريب على الاختبارات المعيارية",
+        "تقرير التدريب على المناهج الحديثة",
+        "تقرير نقل أثر التدريب",
+        "تقرير متابعة الدورات العالمية",
+        "تقرير التطوير المهني المستمر",
+        "تقرير المشاركة في المؤتمرات التعليمية",
+        "تقرير حضور الندوات العلمية",
+        "تقرير المشاركة في البحث التربوي",
+        "تقرير التعلم الذاتي المهني",
+        "تقرير مجتمعات التعلم المهنية",
+        "تقرير القراءة التربوية المتخصصة",
+        "تقرير تبادل الخبرات",
+        "تقرير بناء المسار المهني"
+    ],
+    "تقارير توظيف التكنولوجيا": [
+        "تقرير المحتوى الرقمي المنتج",
+        "تقرير إنتاج المحتوى الرقمي",
+        "تقرير استخدام أنظمة إدارة التعلم",
+        "تقرير التقييم الإلكتروني",
+        "تقرير الواقع المعزز في التعليم",
+        "تقرير الألعاب التعليمية الرقمية",
+        "تقرير توظيف الذكاء الاصطناعي",
+        "تقرير التعلم المتنقل",
+        "تقرير الصفوف الافتراضية",
+        "تقرير أدوات التعلم التفاعلي",
+        "تقرير الأمن الرقمي",
+        "تقرير الثقافة الرقمية",
+        "تقرير التحول الرقمي",
+        "تقرير استخدام التطبيقات التعليمية"
+    ],
+    "تقارير البحث والتطوير المناهجي": [
+        "تقرير تصميم الوحدات التعليمية",
+        "تقرير إعداد المواد التعليمية",
+        "تقرير تطوير المناهج الإثرائية",
+        "تقرير إعداد بنك الأسئلة",
+        "تقرير تصميم الأنشطة اللاصفية",
+        "تقرير تحليل محتوى المنهج",
+        "تقرير مواءمة المنهج مع نواتج التعلم",
+        "تقرير تطوير أدوات التقويم",
+        "تقرير البحث الإجرائي"
+    ],
+    "تقارير الجودة واللجان": [
+        "تقرير عضوية لجنة التميز والجودة",
+        "تقرير عضوية لجنة التدقيق",
+        "تقرير إدارة الموارد التعليمية",
+        "تقرير تحسين الجودة",
+        "تقرير متابعة مؤشرات الأداء",
+        "تقرير التقييم الذاتي",
+        "تقرير الاعتماد المدرسي",
+        "تقرير الخطط التحسينية"
+    ],
+    "تقارير الأمن والسلامة": [
+        "تقرير إجراءات السلامة في الصف",
+        "تقرير الرعاية الصحية في المدرسة",
+        "تقرير جرد المختبرات وغرف المصادر",
+        "تقرير خطط الإخلاء",
+        "تقرير السلامة المدرسية",
+        "تقرير إدارة المخاطر",
+        "تقرير الإسعافات الأولية",
+        "تقرير جاهزية المباني"
+    ]
+}
+
+# =====================================================
+# النصوص الافتراضية للتقارير
+# =====================================================
+DEFAULT_REPORT_TEXTS = {
+    "goal": [
+        "تنمية المهارات الأساسية في المادة وتحقيق الأهداف التعليمية المحددة",
+        "تحسين مستوى التحصيل الدراسي للطلاب وتعزيز دافعيتهم للتعلم",
+        "تطبيق استراتيجيات تعليمية متنوعة لتحسين جودة العملية التعليمية"
+    ],
+    "summary": [
+        "تقرير يوثق الأنشطة التعليمية المنفذة ونتائجها وفق المعايير التربوية",
+        "وثيقة تربوية تسجل الجهود المبذولة لتحقيق أهداف الدرس والمنهج",
+        "تقرير مهني يعكس الممارسات التعليمية الفعالة والتطوير المستمر"
+    ],
+    "steps": [
+        "بدأت الحصة بالتهيئة المناسبة ثم الانتقال إلى شرح المفهوم الرئيسي",
+        "تم تقسيم الطلاب إلى مجموعات تعاونية لممارسة الأنشطة العملية",
+        "شمل التنفيذ العروض التقديمية والتطبيقات العملية والتقويم المستمر"
+    ],
+    "strategies": [
+        "استخدام التعلم التعاوني والتعلم القائم على المشاريع",
+        "توظيف استراتيجيات التفكير الناقد والتعلم النشط",
+        "دمج التقنية في التعليم واستخدام الوسائل المتعددة"
+    ],
+    "strengths": [
+        "تفاعل الطلاب الإيجابي ومشاركتهم الفعالة في الأنشطة",
+        "تنوع الوسائل التعليمية المستخدمة وملاءمتها لأهداف الدرس",
+        "إدارة الصف الفعالة وتنظيم الوقت بشكل مناسب"
+    ],
+    "improve": [
+        "التركيز على الطلاب الضعاف وتقديم دعم إضافي لهم",
+        "زيادة استخدام التقنية التفاعلية في الشرح والتطبيق",
+        "تنويع أساليب التقويم لقياس جميع المهارات"
+    ],
+    "recomm": [
+        "توفير مزيد من التدريب على استراتيجيات التعلم النشط",
+        "تعزيز الشراكة مع أولياء الأمور لمتابعة التحصيل الدراسي",
+        "تطوير بنك الأنشطة الإثرائية لدعم المتفوقين"
+    ]
+}
+
+# =====================================================
+# أدوات ووسائل تعليمية
+# =====================================================
+EDUCATIONAL_TOOLS = [
+    "سبورة",
+    "سبورة ذكية",
+    "جهاز عرض",
+    "أوراق عمل",
+    "حاسب",
+    "عرض تقديمي",
+    "بطاقات تعليمية",
+    "صور توضيحية",
+    "كتاب",
+    "أدوات رياضية"
+]
+
+# =====================================================
+# إدارات التعليم (من الفرونت إند)
+# =====================================================
+EDUCATION_ADMINISTRATIONS = [
+    "الإدارة العامة للتعليم بمنطقة مكة المكرمة",
+    "الإدارة العامة للتعليم بمنطقة الرياض",
+    "الإدارة العامة للتعليم بمنطقة المدينة المنورة",
+    "الإدارة العامة للتعليم بالمنطقة الشرقية",
+    "الإدارة العامة للتعليم بمنطقة القصيم",
+    "الإدارة العامة للتعليم بمنطقة عسير",
+    "الإدارة العامة للتعليم بمنطقة تبوك",
+    "الإدارة العامة للتعليم بمنطقة حائل",
+    "الإدارة العامة للتعليم بمنطقة الحدود الشمالية",
+    "الإدارة العامة للتعليم بمنطقة جازان",
+    "الإدارة العامة للتعليم بمنطقة نجران",
+    "الإدارة العامة للتعليم بمنطقة الباحة",
+    "الإدارة العامة للتعليم بمنطقة الجوف",
+    "الإدارة العامة للتعليم بمحافظة الأحساء",
+    "الإدارة العامة للتعليم بمحافظة الطائف",
+    "الإدارة العامة للتعليم بمحافظة جدة"
+]
@@ -0,0 +1,156 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# ---------- Settings ----------
+MAX_ENTRIES = 10000
+# التوكنات الملغاة في SQLite مشترك حتى يراها كل الـ workers وتبقى بعد إعادة التشغيل
+REVOKED_DB_FILE = os.getenv("TOKEN_REVOKE_PATH", "revoked_tokens.db")
+# كل كم ثانية تُقرأ الإلغاءات الجديدة من القاعدة لمسح التوكنات المخزنة في الكاش
+SYNC_INTERVAL = float(os.getenv("TOKEN_REVOKE_SYNC", "5"))
+
+class TokenCache:
+    """
+    كاش للتوكنات التي تم التحقق من توقيعها: sha256(token) -> payload
+    ينتهي كل عنصر عند exp الخاص بالتوكن، والحجم محدود (LRU).
+    الإلغاء يُحفظ في SQLite حتى exp التوكن: يُفحص عند كل miss، وتُقرأ
+    الإلغاءات الجديدة من الـ workers الأخرى كل sync_interval ثانية.
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES, path=REVOKED_DB_FILE, sync_interval=SYNC_INTERVAL):
+        self.max_entries = max_entries
+        self.path = path
+        self.sync_interval = sync_interval
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._items = OrderedDict()   # digest -> (exp, payload)
+        self._revoked = {}            # digest -> exp (ما قُرئ من القاعدة)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._last_id = 0
+        self._next_sync = 0.0
+
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS revoked_tokens (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                digest BLOB NOT NULL UNIQUE,
+                exp REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_revoked_exp ON revoked_tokens (exp);
+        """)
+        self._sync()
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout=10000")
+            self._local.conn = conn
+        return conn
+
+    def _sync(self):
+        """قراءة الإلغاءات الجديدة (بعد آخر id مقروء) وإخراجها من الكاش"""
+        now = time.time()
+        rows = self._conn().execute(
+            "SELECT id, digest, exp FROM revoked_tokens WHERE id > ? AND exp > ? ORDER BY id",
+            (self._last_id, now)
+        ).fetchall()
+        with self._lock:
+            for row_id, digest, exp in rows:
+                self._revoked[digest] = exp
+                self._items.pop(digest, None)
+                self._last_id = max(self._last_id, row_id)
+            self._next_sync = time.monotonic() + self.sync_interval
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str):
+        if time.monotonic() >= self._next_sync:
+            self._sync()
+        digest = self._digest(token)
+        with self._lock:
+            item = self._items.get(digest)
+            if item is None:
+                self.misses += 1
+                return None
+            exp, payload = item
+            if exp <= time.time():
+                del self._items[digest]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._items.move_to_end(digest)
+            self.hits += 1
+            return payload
+
+    def put(self, token: str, payload: dict):
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+        digest = self._digest(token)
+        with self._lock:
+            if digest in self._revoked:
+                return
+            self._items[digest] = (exp, payload)
+            self._items.move_to_end(digest)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def revoke(self, token: str, exp: float = None):
+        digest = self._digest(token)
+        with self._lock:
+            item = self._items.pop(digest, None)
+            if exp is None:
+                exp = item[0] if item else time.time() + 365 * 24 * 3600
+            self._revoked[digest] = exp
+            self._purge_revoked()
+
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO revoked_tokens (digest, exp) VALUES (?, ?)",
+                (digest, exp)
+            )
+            conn.execute("DELETE FROM revoked_tokens WHERE exp <= ?", (time.time(),))
+
+    def is_revoked(self, token: str) -> bool:
+        """يُستدعى عند الـ miss فقط، فيُفحص في القاعدة مباشرة (قد يكون ألغاه worker آخر)"""
+        digest = self._digest(token)
+        if digest in self._revoked:
+            return True
+        row = self._conn().execute(
+            "SELECT exp FROM revoked_tokens WHERE digest = ? AND exp > ?", (digest, time.time())
+        ).fetchone()
+        if row is None:
+            return False
+        with self._lock:
+            self._revoked[digest] = row[0]
+        return True
+
+    def _purge_revoked(self):
+        now = time.time()
+        for digest in [d for d, exp in self._revoked.items() if exp <= now]:
+            del self._revoked[digest]
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._items),
+            "max_entries": self.max_entries,
+            "revoked": len(self._revoked),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -0,0 +1,208 @@
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime
+
+# ---------- Settings ----------
+DB_FILE = os.getenv("USER_STORE_PATH", "users.db")
+FLUSH_INTERVAL = 1.0
+MAX_PENDING = 1000
+HISTORY_PAGE_SIZE = 50
+MAX_HISTORY_PAGE_SIZE = 200
+
+def _pack(data) -> bytes:
+    return zlib.compress(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+def _unpack(blob: bytes):
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+class UserStore:
+    """
+    تخزين دائم لبيانات المعلمين (ملف شخصي + سجل التقارير + طلبات الدعم).
+    الكتابة مؤجلة (write-behind): تُجمع في الذاكرة وتُكتب دفعة واحدة كل FLUSH_INTERVAL.
+    القراءة O(1) بالمفتاح الأساسي، وبيانات السجل مضغوطة (zlib).
+    """
+
+    def __init__(self, path=DB_FILE, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._profiles = {}    # user_id -> (blob, updated_at)
+        self._inflight = {}    # profiles being written by flush()
+        self._history = []     # (user_id, created_at, blob, content_hash)
+        self._last_hash = {}   # user_id -> content_hash لآخر تقرير في السجل
+        self._support = []     # (created_at, blob)
+
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS profiles (
+                user_id TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                updated_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS report_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                data BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_report_history_user ON report_history (user_id, id);
+            CREATE TABLE IF NOT EXISTS support_requests (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at TEXT NOT NULL,
+                data BLOB NOT NULL
+            );
+        """)
+        # قواعد أُنشئت قبل إضافة content_hash
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(report_history)")}
+        if "content_hash" not in columns:
+            conn.execute("ALTER TABLE report_history ADD COLUMN content_hash TEXT")
+        conn.commit()
+
+        threading.Thread(target=self._run, daemon=True).start()
+        atexit.register(self.flush)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            self._local.conn = conn
+        return conn
+
+    def _pending(self) -> int:
+        return len(self._profiles) + len(self._history) + len(self._support)
+
+    def _queued(self):
+        if self._pending() >= MAX_PENDING:
+            self.flush()
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except sqlite3.Error:
+                # تبقى البيانات في الذاكرة وتُعاد المحاولة في الدورة التالية
+                pass
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                profiles, self._profiles = self._profiles, {}
+                self._inflight = profiles
+                history, self._history = self._history, []
+                support, self._support = self._support, []
+
+            if not (profiles or history or support):
+                return
+
+            try:
+                conn = self._conn()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO profiles (user_id, data, updated_at) VALUES (?, ?, ?)",
+                        [(uid, blob, ts) for uid, (blob, ts) in profiles.items()]
+                    )
+                    conn.executemany(
+                        "INSERT INTO report_history (user_id, created_at, data, content_hash) VALUES (?, ?, ?, ?)",
+                        history
+                    )
+                    conn.executemany(
+                        "INSERT INTO support_requests (created_at, data) VALUES (?, ?)",
+                        support
+                    )
+            except sqlite3.Error:
+                with self._lock:
+                    for uid, item in profiles.items():
+                        self._profiles.setdefault(uid, item)
+                    self._history[:0] = history
+                    self._support[:0] = support
+                raise
+            finally:
+                with self._lock:
+                    self._inflight = {}
+
+    # ---------- Profiles ----------
+    def save_profile(self, user_id: str, data: dict) -> str:
+        updated_at = datetime.utcnow().isoformat()
+        with self._lock:
+            self._profiles[user_id] = (_pack(data), updated_at)
+        self._queued()
+        return updated_at
+
+    def load_profile(self, user_id: str):
+        """يعيد (data, updated_at) أو None"""
+        with self._lock:
+            pending = self._profiles.get(user_id) or self._inflight.get(user_id)
+        if pending:
+            return _unpack(pending[0]), pending[1]
+
+        row = self._conn().execute(
+            "SELECT data, updated_at FROM profiles WHERE user_id = ?", (user_id,)
+        ).fetchone()
+        if not row:
+            return None
+        return _unpack(row[0]), row[1]
+
+    # ---------- Report history ----------
+    def _latest_hash(self, user_id: str):
+        row = self._conn().execute(
+            "SELECT content_hash FROM report_history WHERE user_id = ? ORDER BY id DESC LIMIT 1",
+            (user_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def add_history(self, user_id: str, entry: dict, content_hash: str = None) -> bool:
+        """
+        إضافة تقرير للسجل. إذا طابق content_hash آخر تقرير لنفس المستخدم يُتجاهل
+        (الحفظ التلقائي أو تكرار حفظ نفس التقرير). يعيد True إذا أُضيف.
+        """
+        latest = None
+        if content_hash is not None:
+            with self._lock:
+                latest = self._last_hash.get(user_id)
+            if latest is None:
+                latest = self._latest_hash(user_id)
+
+        with self._lock:
+            if content_hash is not None and content_hash == self._last_hash.get(user_id, latest):
+                return False
+            self._history.append((user_id, datetime.utcnow().isoformat(), _pack(entry), content_hash))
+            if content_hash is not None:
+                self._last_hash[user_id] = content_hash
+        self._queued()
+        return True
+
+    def history_since(self, user_id: str, since: int = 0, limit: int = HISTORY_PAGE_SIZE):
+        """السجل بعد id معين (مزامنة تدريجية). يعيد items و next_since"""
+        self.flush()
+        limit = min(max(limit, 1), MAX_HISTORY_PAGE_SIZE)
+        rows = self._conn().execute("""
+            SELECT id, created_at, data FROM report_history
+            WHERE user_id = ? AND id > ?
+            ORDER BY id
+            LIMIT ?
+        """, (user_id, since, limit)).fetchall()
+
+        items = [
+            {"id": r[0], "created_at": r[1], "data": _unpack(r[2])}
+            for r in rows
+        ]
+        return {
+            "items": items,
+            "next_since": items[-1]["id"] if items else since,
+            "has_more": len(items) == limit
+        }
+
+    # ---------- Support ----------
+    def add_support_request(self, data: dict):
+        with self._lock:
+            self._support.append((data.get("timestamp") or datetime.utcnow().isoformat(), _pack(data)))
+        self._queued()